@@ -0,0 +1,157 @@
+"""Benchmark world generation stages across map sizes and seeds.
+
+Usage:
+    python -m benchmarks.world_generation [--sizes 192 512] [--seeds 1 7] [--output results.json]
+
+Each stage is timed in one pass and, unless --no-memory is given, run again
+under tracemalloc to record its peak traced allocation (numpy arrays included).
+Timing and memory are measured separately because tracemalloc slows
+Python-heavy stages down considerably. Results are written as JSON.
+"""
+import argparse
+import json
+import logging
+import os
+import platform
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Optional, Tuple
+import numpy as np
+from dnd_adventure.game_world import GameWorld
+from dnd_adventure.map_cache import MapCache
+from dnd_adventure.map_generator import MapGenerator, GENERATOR_VERSION
+from dnd_adventure.tile_store import TileStore
+from dnd_adventure.world import World
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SIZES = [192, 512, 1024, 2048]
+DEFAULT_SEEDS = [1, 7, 42]
+ROOMS_MATERIALIZED = 256  # rooms built by the generate_dungeons_and_castles stage
+STAGES = ["pregenerate", "assign_countries", "world_init_cold", "world_init_warm", "generate_dungeons_and_castles"]
+
+# A stage is (setup, run): setup is untimed and returns the argument passed to run.
+Stage = Tuple[Callable[[], object], Callable[[object], object]]
+
+
+def build_stages(size: int, seed: int, cache_dir: str) -> Dict[str, Stage]:
+    def terrain_tiles():
+        generator = MapGenerator(seed)
+        countries = generator.generate_countries(size, size)
+        return generator, TileStore.from_terrain(0, 0, generator.engine.generate_region(0, 0, size, size), len(countries)), countries
+
+    def fresh_cache():
+        shutil.rmtree(cache_dir, ignore_errors=True)
+        return MapCache(cache_dir)
+
+    def warm_cache():
+        cache = MapCache(cache_dir)
+        World(seed=seed, width=size, height=size, map_cache=cache)
+        return cache
+
+    def world_for_rooms():
+        cache = MapCache(cache_dir)
+        world = World(seed=seed, width=size, height=size, map_cache=cache)
+        world.pregenerate()  # chunk generation and connecting are timed by the pregenerate stage
+        # Group the rooms afresh on every run instead of loading the cached graph
+        path = cache.entry_path(world.cache_key, "complexes")
+        if os.path.exists(path):
+            os.remove(path)
+        return world
+
+    def dungeons_and_castles(world):
+        game_world = GameWorld(world)
+        graph = world.complexes.graph
+        for x, y in zip(graph.xs[:ROOMS_MATERIALIZED].tolist(), graph.ys[:ROOMS_MATERIALIZED].tolist()):
+            game_world.rooms[f"{x},{y}"]
+        return game_world
+
+    return {
+        "pregenerate": (lambda: World(seed=seed, width=size, height=size, map_cache=fresh_cache()), lambda world: world.pregenerate()),
+        "assign_countries": (terrain_tiles, lambda args: args[0].assign_countries(args[1], args[2])),
+        "world_init_cold": (fresh_cache, lambda cache: World(seed=seed, width=size, height=size, map_cache=cache)),
+        "world_init_warm": (warm_cache, lambda cache: World(seed=seed, width=size, height=size, map_cache=cache)),
+        "generate_dungeons_and_castles": (world_for_rooms, dungeons_and_castles)
+    }
+
+
+def time_stage(stage: Stage) -> float:
+    setup, run = stage
+    argument = setup()
+    start = time.perf_counter()
+    run(argument)
+    return time.perf_counter() - start
+
+
+def peak_memory(stage: Stage) -> int:
+    setup, run = stage
+    argument = setup()
+    tracemalloc.start()
+    try:
+        run(argument)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+def run_benchmarks(sizes: List[int], seeds: List[int], stages: List[str], measure_memory: bool = True) -> Dict:
+    results = []
+    cache_dir = tempfile.mkdtemp(prefix="dnd_bench_")
+    try:
+        for size in sizes:
+            for seed in seeds:
+                available = build_stages(size, seed, cache_dir)
+                for name in stages:
+                    seconds = time_stage(available[name])
+                    peak = peak_memory(available[name]) if measure_memory else None
+                    results.append({"stage": name, "size": size, "seed": seed, "seconds": round(seconds, 6), "peak_bytes": peak})
+                    logger.info(f"{name} {size}x{size} seed={seed}: {seconds:.3f}s, peak {peak} bytes")
+                    print(f"{name:32} {size:>5}² seed {seed:<6} {seconds:9.3f}s  peak {_format_bytes(peak)}", file=sys.stderr)
+    finally:
+        shutil.rmtree(cache_dir, ignore_errors=True)
+    return {
+        "generator_version": GENERATOR_VERSION,
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "results": results
+    }
+
+
+def _format_bytes(size: Optional[int]) -> str:
+    if size is None:
+        return "-"
+    if size < 1024:
+        return f"{size} B"
+    for unit in ("KiB", "MiB"):
+        size /= 1024
+        if size < 1024:
+            return f"{size:.1f} {unit}"
+    size /= 1024
+    return f"{size:.1f} GiB"
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Benchmark world generation stages.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="map edge lengths")
+    parser.add_argument("--seeds", type=int, nargs="+", default=DEFAULT_SEEDS)
+    parser.add_argument("--stages", nargs="+", choices=STAGES, default=STAGES)
+    parser.add_argument("--no-memory", action="store_true", help="skip the tracemalloc pass")
+    parser.add_argument("--output", help="write JSON results here instead of stdout")
+    args = parser.parse_args(argv)
+    report = run_benchmarks(args.sizes, args.seeds, args.stages, measure_memory=not args.no_memory)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+
+
+if __name__ == "__main__":
+    main()
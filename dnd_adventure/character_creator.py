@@ -27,7 +27,9 @@ def create_player(name: str, game: object) -> 'Character':
         "stats": None,
         "stat_dict": None,
         "spells": None,
-        "domain": None
+        "domain": None,
+        "name": name,
+        "spell_seed": game.world.seed
     }
 
     try:
@@ -117,7 +119,9 @@ def create_player(name: str, game: object) -> 'Character':
             selections["class"],
             character_level=1,
             stat_dict=selections["stat_dict"],
-            domain=selections["domain"]
+            domain=selections["domain"],
+            seed=selections["spell_seed"],
+            character=name
         )
 
         confirmed = review_selections(selections, races, classes)
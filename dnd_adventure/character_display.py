@@ -19,7 +19,9 @@ def create_player(player_name: str, game: 'Game') -> Character:
         "stats": [],
         "stat_dict": {},
         "spells": {0: [], 1: []},
-        "domain": None
+        "domain": None,
+        "name": player_name,
+        "spell_seed": game.world.seed
     }
     
     # Race selection
@@ -59,7 +61,7 @@ def create_player(player_name: str, game: 'Game') -> Character:
     if selections["class"] in spellcasting_classes:
         selections["spells"] = select_spells(
             selections["class"], character_level=1, stat_dict=selections["stat_dict"],
-            domain=selections["domain"]
+            domain=selections["domain"], seed=selections["spell_seed"], character=player_name
         )
     
     # Review selections
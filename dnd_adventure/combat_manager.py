@@ -1,4 +1,3 @@
-import random
 import logging
 from typing import List
 from colorama import Fore, Style
@@ -9,6 +8,9 @@ logger = logging.getLogger(__name__)
 class CombatManager:
     def __init__(self, game):
         self.game = game
+        # Rolls come from the world's counter-based combat stream; its position is saved with the game
+        # (keyed by the loaded character's name: player_name is None when continuing a saved game)
+        self.rng = game.world.rng.stream("combat", game.player.name.lower())
 
     def calculate_monster_difficulty(self, monster: Monster) -> float:
         hp_score = monster.hit_points
@@ -54,18 +56,20 @@ class CombatManager:
         monster = room.monsters[0]
         bab = self.game.player.bab
         str_mod = self.game.player.get_stat_modifier(0)
-        attack_roll = random.randint(1, 20) + bab + str_mod
+        attack_roll = self.rng.randint(1, 20) + bab + str_mod
         print(f"{self.game.player.name} attacks {monster.name} (Roll: {attack_roll})")
         logger.debug(f"Attack roll: {attack_roll} vs {monster.armor_class}")
         if attack_roll >= monster.armor_class:
-            damage = max(1, random.randint(1, 8) + str_mod)
+            damage = max(1, self.rng.randint(1, 8) + str_mod)
             monster.hit_points -= damage
             print(f"Hit! {monster.name} takes {damage} damage (HP: {monster.hit_points})")
             logger.debug(f"Hit: {monster.name} takes {damage} damage, HP now {monster.hit_points}")
             if monster.hit_points <= 0:
                 print(f"{monster.name} is defeated!")
                 xp_reward = self.calculate_xp_reward(monster)
-                room.monsters.remove(monster)
+                room.monster_died(monster)
+                if not room.monsters:
+                    self._room_cleared()
                 self.game.player.gain_xp(xp_reward)
                 self.game.player_manager.check_level_up()
                 logger.info(f"Defeated {monster.name}, gained {xp_reward} XP")
@@ -79,13 +83,20 @@ class CombatManager:
         if room.monsters:
             self.handle_monster_attack(monster)
 
+    def _room_cleared(self):
+        complex_id = self.game.game_world.mark_cleared(self.game.current_room)
+        if complex_id is not None:
+            graph = self.game.world.complexes.graph
+            print(f"{Fore.GREEN}You have cleared the whole {graph.terrain_of(complex_id)} ({graph.size(complex_id)} rooms)!{Style.RESET_ALL}")
+            logger.info(f"Cleared complex {complex_id} at {self.game.current_room}")
+
     def handle_monster_attack(self, monster: Monster):
         if not monster.attacks:
             print(f"{monster.name} has no attacks!")
             logger.debug(f"No attacks for {monster.name}")
             return
-        attack = random.choice(monster.attacks)
-        attack_roll = random.randint(1, 20) + attack.attack_bonus
+        attack = self.rng.choice(monster.attacks)
+        attack_roll = self.rng.randint(1, 20) + attack.attack_bonus
         print(f"{monster.name} attacks {self.game.player.name} (Roll: {attack_roll})")
         logger.debug(f"Monster attack roll: {attack_roll} vs {self.game.player.armor_class}")
         if attack_roll >= self.game.player.armor_class:
@@ -93,7 +104,7 @@ class CombatManager:
             dice_part = damage_parts[0]
             bonus = int(damage_parts[1]) if len(damage_parts) > 1 else 0
             num_dice, die_size = map(int, dice_part.split('d'))
-            damage = sum(random.randint(1, die_size) for _ in range(num_dice)) + bonus
+            damage = sum(self.rng.randint(1, die_size) for _ in range(num_dice)) + bonus
             damage = max(1, damage)
             self.game.player.hit_points -= damage
             print(f"Hit! {self.game.player.name} takes {damage} damage (HP: {self.game.player.hit_points})")
@@ -134,12 +145,15 @@ class CombatManager:
                 print(result)
                 logger.debug(f"Cast spell: {spell_name}, Result: {result}")
                 if "dealing" in result and room.monsters and room.monsters[0].hit_points <= 0:
-                    print(f"{room.monsters[0].name} is defeated!")
-                    xp_reward = self.calculate_xp_reward(room.monsters[0])
-                    room.monsters.pop(0)
+                    monster = room.monsters[0]
+                    print(f"{monster.name} is defeated!")
+                    xp_reward = self.calculate_xp_reward(monster)
+                    room.monster_died(monster)
+                    if not room.monsters:
+                        self._room_cleared()
                     self.game.player.gain_xp(xp_reward)
                     self.game.player_manager.check_level_up()
-                    logger.info(f"Defeated {room.monsters[0].name} with spell, gained {xp_reward} XP")
+                    logger.info(f"Defeated {monster.name} with spell, gained {xp_reward} XP")
                     if self.game.current_room and "temp_" in self.game.current_room:
                         del self.game.game_world.rooms[self.game.current_room]
                         self.game.current_room = None
@@ -0,0 +1,176 @@
+import logging
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+import numpy as np
+from dnd_adventure.terrain_engine import TERRAIN_TYPES, TERRAIN_CODES
+from dnd_adventure.walkability import label_components
+
+if TYPE_CHECKING:
+    from dnd_adventure.world import World
+
+logger = logging.getLogger(__name__)
+
+COMPLEX_TERRAINS: Tuple[str, ...] = ("dungeon", "castle")
+# Exit directions in CSR order; index into this tuple is the stored direction code.
+DIRECTIONS: Tuple[Tuple[str, Tuple[int, int]], ...] = (
+    ("north", (0, 1)), ("south", (0, -1)), ("east", (1, 0)), ("west", (-1, 0))
+)
+
+
+class ComplexGraph:
+    """Room tiles grouped into multi-tile complexes, with exits as a CSR graph.
+
+    Nodes are dungeon/castle tiles in row-major order (xs, ys, keys = y * width
+    + x). Adjacent tiles of the same terrain form one complex, found with the
+    run-based union-find in walkability.label_components. A node's exits are
+    `indices[indptr[n]:indptr[n + 1]]`, with `exit_dirs` giving the DIRECTIONS
+    code of each, and a complex's nodes are
+    `complex_nodes[complex_indptr[c]:complex_indptr[c + 1]]`.
+    """
+
+    def __init__(self, width: int, terrain: np.ndarray):
+        self.width = width
+        height = terrain.shape[0]
+        labels = np.zeros(terrain.shape, dtype=np.int64)
+        offset = 0
+        for name in COMPLEX_TERRAINS:
+            mask = terrain == TERRAIN_CODES[name]
+            part, count = label_components(mask)
+            labels[mask] = part[mask] + offset
+            offset += count
+        self.num_complexes = offset
+
+        ys, xs = np.nonzero(labels)
+        self.xs = xs.astype(np.int32)
+        self.ys = ys.astype(np.int32)
+        self.keys = ys.astype(np.int64) * width + xs
+        self.node_complex = (labels[ys, xs] - 1).astype(np.int32)
+        node_terrain = terrain[ys, xs]
+        self.complex_terrain = np.zeros(self.num_complexes, dtype=np.uint8)
+        self.complex_terrain[self.node_complex] = node_terrain
+
+        sources, targets, dirs = [], [], []
+        for code, (_, (dx, dy)) in enumerate(DIRECTIONS):
+            nx, ny = self.xs + dx, self.ys + dy
+            inside = (nx >= 0) & (nx < width) & (ny >= 0) & (ny < height)
+            node = np.flatnonzero(inside)
+            found = self.find_nodes(nx[node], ny[node])
+            same = found >= 0
+            same[same] = node_terrain[found[same]] == node_terrain[node[same]]
+            sources.append(node[same])
+            targets.append(found[same])
+            dirs.append(np.full(same.sum(), code, dtype=np.uint8))
+        sources = np.concatenate(sources)
+        order = np.argsort(sources, kind="stable")
+        self.indices = np.concatenate(targets)[order].astype(np.int32)
+        self.exit_dirs = np.concatenate(dirs)[order]
+        self.indptr = np.zeros(len(self.keys) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(sources, minlength=len(self.keys)), out=self.indptr[1:])
+
+        self.complex_nodes = np.argsort(self.node_complex, kind="stable").astype(np.int32)
+        self.complex_indptr = np.zeros(self.num_complexes + 1, dtype=np.int64)
+        np.cumsum(np.bincount(self.node_complex, minlength=self.num_complexes), out=self.complex_indptr[1:])
+        self.cleared = np.zeros(len(self.keys), dtype=bool)
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def find_nodes(self, xs: np.ndarray, ys: np.ndarray) -> np.ndarray:
+        """Node index of each (x, y), or -1 where the tile is not a room tile."""
+        keys = np.asarray(ys, dtype=np.int64) * self.width + np.asarray(xs, dtype=np.int64)
+        index = np.searchsorted(self.keys, keys)
+        index = np.minimum(index, max(len(self.keys) - 1, 0))
+        hit = (self.keys[index] == keys) if len(self.keys) else np.zeros(keys.shape, dtype=bool)
+        return np.where(hit, index, -1)
+
+    def node_at(self, x: int, y: int) -> Optional[int]:
+        node = int(self.find_nodes(np.array([x]), np.array([y]))[0])
+        return None if node < 0 else node
+
+    def exits(self, node: int) -> Dict[str, str]:
+        """Exits of a node as the {"north": "x,y", ...} mapping rooms use."""
+        start, end = self.indptr[node], self.indptr[node + 1]
+        return {
+            DIRECTIONS[direction][0]: f"{self.xs[target]},{self.ys[target]}"
+            for target, direction in zip(self.indices[start:end].tolist(), self.exit_dirs[start:end].tolist())
+        }
+
+    def complex_of(self, node: int) -> int:
+        return int(self.node_complex[node])
+
+    def nodes_in(self, complex_id: int) -> np.ndarray:
+        return self.complex_nodes[self.complex_indptr[complex_id]:self.complex_indptr[complex_id + 1]]
+
+    def rooms_in(self, complex_id: int) -> List[Tuple[int, int]]:
+        nodes = self.nodes_in(complex_id)
+        return list(zip(self.xs[nodes].tolist(), self.ys[nodes].tolist()))
+
+    def size(self, complex_id: int) -> int:
+        return int(self.complex_indptr[complex_id + 1] - self.complex_indptr[complex_id])
+
+    def terrain_of(self, complex_id: int) -> str:
+        return TERRAIN_TYPES[self.complex_terrain[complex_id]]
+
+    def mark_cleared(self, node: int, cleared: bool = True):
+        self.cleared[node] = cleared
+
+    def is_cleared(self, complex_id: int) -> bool:
+        return bool(self.cleared[self.nodes_in(complex_id)].all())
+
+    def cleared_fraction(self, complex_id: int) -> float:
+        return float(self.cleared[self.nodes_in(complex_id)].mean())
+
+    def cleared_keys(self) -> np.ndarray:
+        return self.keys[self.cleared]
+
+    def restore_cleared(self, keys: np.ndarray):
+        """Re-apply clear state by tile key, e.g. after the graph was rebuilt."""
+        nodes = self.find_nodes(keys % self.width, keys // self.width)
+        self.cleared[nodes[nodes >= 0]] = True
+
+
+class WorldComplexes:
+    """The ComplexGraph of a World: cached per overlay-edit digest, rebuilt after terrain edits."""
+
+    def __init__(self, world: "World"):
+        self.world = world
+        self._graph: Optional[ComplexGraph] = None
+        self._pending_cleared: Optional[np.ndarray] = None
+        world.overlay.listeners.append(self._on_edit)
+
+    def _on_edit(self, x: int, y: int, changed: Dict):
+        if self._graph is not None and "type" in changed:
+            was_room = self._graph.node_at(x, y) is not None
+            if was_room or changed["type"] in COMPLEX_TERRAINS:
+                self._pending_cleared = self._graph.cleared_keys()
+                self._graph = None
+
+    def cleared_keys(self) -> np.ndarray:
+        """Keys of cleared room tiles, without building the graph if it is not loaded."""
+        if self._graph is not None:
+            return self._graph.cleared_keys()
+        return self._pending_cleared if self._pending_cleared is not None else np.zeros(0, dtype=np.int64)
+
+    def restore_cleared(self, keys: np.ndarray):
+        """Mark tiles cleared by key; applied when the graph is next built if it is not loaded yet."""
+        if self._graph is not None:
+            self._graph.restore_cleared(keys)
+        elif self._pending_cleared is not None:
+            self._pending_cleared = np.union1d(self._pending_cleared, keys)
+        else:
+            self._pending_cleared = keys
+
+    @property
+    def graph(self) -> ComplexGraph:
+        if self._graph is None:
+            digest = self.world.overlay.digest()
+            cached = self.world.map_cache.load(self.world.cache_key, "complexes")
+            if cached is not None and cached["edits"] == digest:
+                self._graph = cached["graph"]
+            else:
+                self._graph = ComplexGraph(self.world.width, self.world.connectivity.terrain())
+                self.world.map_cache.store(self.world.cache_key, "complexes", {"edits": digest, "graph": self._graph})
+                logger.info(f"Grouped {len(self._graph)} room tiles into {self._graph.num_complexes} complexes")
+            if self._pending_cleared is not None:
+                self._graph.restore_cleared(self._pending_cleared)
+                self._pending_cleared = None
+        return self._graph
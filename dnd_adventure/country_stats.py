@@ -0,0 +1,137 @@
+import logging
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+import numpy as np
+from dnd_adventure.terrain_engine import TERRAIN_TYPES
+
+if TYPE_CHECKING:
+    from dnd_adventure.world import World
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CountryStats:
+    id: int
+    name: str
+    capital: Tuple[int, int]
+    area: int = 0
+    terrain: Dict[str, int] = field(default_factory=dict)
+    border_tiles: int = 0
+    neighbours: List[int] = field(default_factory=list)
+
+
+class CountryTable:
+    """Per-country statistics, indexed by id and by name.
+
+    Computed in one pass over the world, a band of chunk rows at a time, with
+    bincounts for area and terrain mix and shifted comparisons for borders and
+    adjacency. Cached in the MapCache alongside a digest of the overlay edits it
+    saw; edits to terrain or country drop it until next use.
+    """
+
+    FIELDS = ("type", "country")
+
+    def __init__(self, world: "World"):
+        self.world = world
+        self._by_id: Optional[Dict[int, CountryStats]] = None
+        self._by_name: Dict[str, CountryStats] = {}
+        world.overlay.listeners.append(self._on_edit)
+
+    def _on_edit(self, x: int, y: int, changed: Dict):
+        if any(name in changed for name in self.FIELDS):
+            self._by_id = None
+
+    @property
+    def by_id(self) -> Dict[int, CountryStats]:
+        if self._by_id is None:
+            digest = self.world.overlay.digest(self.FIELDS)
+            cached = self.world.map_cache.load(self.world.cache_key, "country_stats")
+            if cached is not None and cached["edits"] == digest:
+                stats = cached["stats"]
+            else:
+                stats = self.compute()
+                self.world.map_cache.store(self.world.cache_key, "country_stats", {"edits": digest, "stats": stats})
+            self._by_id = {country.id: country for country in stats}
+            self._by_name = {country.name.lower(): country for country in stats}
+        return self._by_id
+
+    def get(self, country_id: Optional[int]) -> Optional[CountryStats]:
+        if country_id is None:
+            return None
+        return self.by_id.get(country_id)
+
+    def find(self, name: str) -> Optional[CountryStats]:
+        self.by_id  # loads the table
+        return self._by_name.get(name.lower())
+
+    def at(self, x: int, y: int) -> Optional[CountryStats]:
+        return self.get(self.world.get_location(x, y).get("country"))
+
+    def _band(self, cy: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Terrain codes and country indices of one chunk row, overlay edits applied.
+
+        Tiles without a country get index len(countries).
+        """
+        chunks = self.world.chunks
+        y0 = cy * chunks.chunk_size
+        y1 = min(y0 + chunks.chunk_size, self.world.height)
+        terrain = self.world.terrain_window(0, y0, self.world.width, y1)
+        country = self.world.country_window(0, y0, self.world.width, y1)
+        no_country = np.iinfo(country.dtype).max
+        country = country.astype(np.int64)
+        country[country == no_country] = len(self.world.map["countries"])
+        return terrain, country
+
+    def compute(self) -> List[CountryStats]:
+        countries = self.world.map["countries"]
+        n = len(countries)
+        kinds = len(TERRAIN_TYPES)
+        area = np.zeros(n + 1, dtype=np.int64)
+        mix = np.zeros((n + 1) * kinds, dtype=np.int64)
+        borders = np.zeros(n + 1, dtype=np.int64)
+        pairs = set()
+        chunks_y = self.world.chunks.chunks_y
+        previous_row = None
+        current = self._band(0)
+        for cy in range(chunks_y):
+            upcoming = self._band(cy + 1) if cy + 1 < chunks_y else None
+            terrain, country = current
+            area += np.bincount(country.ravel(), minlength=n + 1)
+            mix += np.bincount((country * kinds + terrain).ravel(), minlength=(n + 1) * kinds)
+            # Compare every tile with its right and lower neighbour, including across bands
+            below = np.vstack([country[1:], upcoming[1][:1]]) if upcoming is not None else country[1:]
+            above = np.vstack([previous_row, country[:-1]]) if previous_row is not None else country[:-1]
+            border = np.zeros(country.shape, dtype=bool)
+            horizontal = country[:, :-1] != country[:, 1:]
+            border[:, :-1] |= horizontal
+            border[:, 1:] |= horizontal
+            border[:below.shape[0]] |= country[:below.shape[0]] != below
+            border[country.shape[0] - above.shape[0]:] |= country[country.shape[0] - above.shape[0]:] != above
+            borders += np.bincount(country[border], minlength=n + 1)
+            for a, b in ((country[:, :-1], country[:, 1:]), (country[:below.shape[0]], below)):
+                differ = a != b
+                keys = np.unique(a[differ] * (n + 1) + b[differ])
+                pairs.update(divmod(int(key), n + 1) for key in keys)
+            previous_row = country[-1:]
+            current = upcoming
+
+        neighbours: Dict[int, set] = {i: set() for i in range(n)}
+        for a, b in pairs:
+            if a < n and b < n:
+                neighbours[a].add(b)
+                neighbours[b].add(a)
+        mix = mix.reshape(n + 1, kinds)
+        stats = []
+        for index, country in enumerate(countries):
+            stats.append(CountryStats(
+                id=country["id"],
+                name=country["name"],
+                capital=tuple(country["capital"]),
+                area=int(area[index]),
+                terrain={TERRAIN_TYPES[code]: int(mix[index, code]) for code in range(kinds) if mix[index, code]},
+                border_tiles=int(borders[index]),
+                neighbours=sorted(countries[other]["id"] for other in neighbours[index])
+            ))
+        logger.info(f"Computed statistics for {n} countries in {self.world.cache_key}")
+        return stats
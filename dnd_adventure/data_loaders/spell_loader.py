@@ -5,13 +5,16 @@ from pathlib import Path
 from typing import Dict, List, Optional
 from dnd_adventure.spells import Spell, CORE_SPELLS
 from dnd_adventure.data_loaders.data_utils import ensure_data_dir
+from dnd_adventure.rng import RNGService
 
 logger = logging.getLogger(__name__)
 
 class SpellLoader:
-    def __init__(self):
+    def __init__(self, seed: Optional[int] = None, character: str = ""):
+        # Stat requirements are rolled per world seed, character and spell; without a seed they differ every run
         self.data_dir = ensure_data_dir()
-        random.seed()
+        self.rng = RNGService(seed if seed is not None else random.randrange(2 ** 32))
+        self.character = character
 
     def load_spells_from_json(self) -> Dict[str, Dict[int, List[Spell]]]:
         try:
@@ -54,7 +57,7 @@ class SpellLoader:
                         
                         primary_stat = spell.get("primary_stat", class_stat)
                         stat_requirement = {
-                            primary_stat: random.randint(max(6, 6 + level - 2), 6 + level)
+                            primary_stat: self.rng.stream("spell-requirement", self.character, class_key, spell["name"]).randint(max(6, 6 + level - 2), 6 + level)
                         }
                         logger.debug(f"Loaded spell: {spell['name']} (Level {level}, Stat Requirement: {stat_requirement})")
                         
@@ -128,7 +131,7 @@ class SpellLoader:
                                     mp_cost=spell_obj.mp_cost,
                                     min_level=spell_obj.min_level,
                                     stat_requirement={
-                                        spell_obj.primary_stat: random.randint(max(6, 6 + level - 2), 6 + level)
+                                        spell_obj.primary_stat: self.rng.stream("spell-requirement", self.character, "Cleric", domain, spell_obj.name).randint(max(6, 6 + level - 2), 6 + level)
                                     },
                                     primary_stat=spell_obj.primary_stat,
                                     domain=domain
@@ -23,7 +23,8 @@ class Monster:
                  abilities: Optional[Dict[str, int]] = None,
                  attacks: Optional[List[Attack]] = None,
                  spell_like_abilities: Optional[Dict[str, str]] = None,
-                 abilities_list: Optional[List] = None):
+                 abilities_list: Optional[List] = None,
+                 environment: Optional[str] = None):
         self.name = name
         self.type = type
         self.armor_class = armor_class
@@ -41,6 +42,7 @@ class Monster:
         self.attacks = attacks or []
         self.spell_like_abilities = spell_like_abilities or {}
         self.abilities_list = abilities_list or []
+        self.environment = environment or "Any"
 
     def __repr__(self):
         return (f"Monster({self.name}, Type: {self.type}, CR: {self.challenge_rating}, "
@@ -110,7 +112,8 @@ def load_monsters_from_json() -> List[Monster]:
                         abilities=abilities,
                         attacks=attacks,
                         spell_like_abilities=monster_data.get('spell_like_abilities'),
-                        abilities_list=monster_data.get('abilities_list')
+                        abilities_list=monster_data.get('abilities_list'),
+                        environment=monster_data.get('environment')
                     )
 
                     monsters.append(monster)
@@ -125,26 +128,31 @@ def load_monsters_from_json() -> List[Monster]:
 
 SRD_MONSTERS = load_monsters_from_json()
 
+
+def _index(key) -> Dict:
+    index: Dict = {}
+    for m in SRD_MONSTERS:
+        index.setdefault(key(m), []).append(m)
+    return index
+
+
+# Lookup tables built once at import; the helpers below answer from them instead of rescanning SRD_MONSTERS
+_BY_NAME = _index(lambda m: m.name.lower())
+_BY_CR = _index(lambda m: m.challenge_rating)
+_BY_TYPE = _index(lambda m: m.type.lower())
+_BY_AC = _index(lambda m: m.armor_class)
+
 def get_monsters_by_cr(cr: float) -> List[Monster]:
-    return [m for m in SRD_MONSTERS if m.challenge_rating == cr]
+    return list(_BY_CR.get(cr, ()))
 
 def get_monsters_by_type(monster_type: str) -> List[Monster]:
-    return [m for m in SRD_MONSTERS if m.type.lower() == monster_type.lower()]
+    return list(_BY_TYPE.get(monster_type.lower(), ()))
 
 def get_monster_by_name(name: str) -> Optional[Monster]:
-    for m in SRD_MONSTERS:
-        if m.name.lower() == name.lower():
-            return m
-    return None
+    return _BY_NAME.get(name.lower(), [None])[0]
 
 def get_monster_by_cr(cr: float) -> Optional[Monster]:
-    for m in SRD_MONSTERS:
-        if m.challenge_rating == cr:
-            return m
-    return None
+    return _BY_CR.get(cr, [None])[0]
 
 def get_monster_by_ac(ac: int) -> Optional[Monster]:
-    for m in SRD_MONSTERS:
-        if m.armor_class == ac:
-            return m
-    return None
\ No newline at end of file
+    return _BY_AC.get(ac, [None])[0]
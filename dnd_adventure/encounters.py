@@ -0,0 +1,129 @@
+import copy
+import logging
+import random
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence, Tuple
+from dnd_adventure.dnd35e.core.monsters import Monster, SRD_MONSTERS
+
+if TYPE_CHECKING:
+    from dnd_adventure.world import World
+
+logger = logging.getLogger(__name__)
+
+# Chance that a room of each terrain holds an encounter, and the `environment`
+# keywords (from srd_monsters.json) that make a monster at home there.
+ENCOUNTER_CHANCE: Dict[str, float] = {"dungeon": 0.35, "castle": 0.2}
+ENCOUNTER_ENVIRONMENTS: Dict[str, Tuple[str, ...]] = {
+    "dungeon": ("underground", "any"),
+    "castle": ("any", "hells", "mountains")
+}
+HOME_WEIGHT = 4.0
+MAX_GROUP = 3
+
+
+class AliasTable:
+    """Weighted choice among n outcomes in O(1) per draw (Vose's alias method)."""
+
+    __slots__ = ("prob", "alias")
+
+    def __init__(self, weights: Sequence[float]):
+        n = len(weights)
+        total = float(sum(weights))
+        scaled = [w * n / total for w in weights]
+        self.prob = [1.0] * n
+        self.alias = list(range(n))
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+        while small and large:
+            less, more = small.pop(), large.pop()
+            self.prob[less] = scaled[less]
+            self.alias[less] = more
+            scaled[more] -= 1.0 - scaled[less]
+            (small if scaled[more] < 1.0 else large).append(more)
+        # Whatever is left is 1.0 up to rounding error
+
+    def __len__(self) -> int:
+        return len(self.prob)
+
+    def sample(self, rng: random.Random) -> int:
+        u = rng.random() * len(self.prob)
+        index = int(u)
+        return index if u - index < self.prob[index] else self.alias[index]
+
+
+class EncounterTables:
+    """Alias tables of monsters per (terrain, challenge rating), built once from SRD_MONSTERS.
+
+    Each table holds only the monsters of that CR (fractional CRs count as
+    their whole part) or, where there are none, of the nearest CR that has
+    some, lower first on a tie. Monsters at home in the terrain are weighted
+    up, so the target CR decides how tough an encounter is and the terrain
+    decides which monsters of that CR show up.
+    """
+
+    def __init__(self, monsters: Optional[List[Monster]] = None):
+        self.monsters = list(SRD_MONSTERS if monsters is None else monsters)
+        self.max_cr = int(max((m.challenge_rating for m in self.monsters), default=0))
+        self.tables: Dict[Tuple[str, int], Tuple[List[int], AliasTable]] = {}
+        if not self.monsters:
+            return
+        by_cr: Dict[int, List[int]] = {}
+        for index, monster in enumerate(self.monsters):
+            by_cr.setdefault(int(monster.challenge_rating), []).append(index)
+        for terrain, keywords in ENCOUNTER_ENVIRONMENTS.items():
+            for cr in range(self.max_cr + 1):
+                band = by_cr[min(by_cr, key=lambda other: (abs(other - cr), other))]
+                weights = [
+                    HOME_WEIGHT if any(k in self.monsters[i].environment.lower() for k in keywords) else 1.0 for i in band
+                ]
+                self.tables[terrain, cr] = (band, AliasTable(weights))
+        logger.debug(f"Built {len(self.tables)} encounter tables for {len(self.monsters)} monsters")
+
+    def draw(self, terrain: str, cr: int, rng: random.Random) -> Monster:
+        band, table = self.tables[terrain, max(0, min(cr, self.max_cr))]
+        return copy.deepcopy(self.monsters[band[table.sample(rng)]])
+
+
+_tables: Optional[EncounterTables] = None
+
+
+def encounter_tables() -> EncounterTables:
+    """The shared tables, built on first use."""
+    global _tables
+    if _tables is None:
+        _tables = EncounterTables()
+    return _tables
+
+
+class EncounterSpawner:
+    """Decides which monsters a dungeon or castle room holds when it is built.
+
+    Each room draws from its own RNG stream keyed by its coordinates, so a room
+    gets the same encounter however often it is rebuilt, and rooms are only
+    stocked when first looked up. Bigger complexes host tougher monsters.
+    """
+
+    def __init__(self, world: "World"):
+        self.world = world
+
+    def target_cr(self, complex_size: int) -> int:
+        return 2 * complex_size - 1
+
+    def _roll(self, x: int, y: int, terrain: str) -> Optional[random.Random]:
+        """The room's RNG stream if it holds an encounter, after the roll that decided it."""
+        chance = ENCOUNTER_CHANCE.get(terrain, 0.0)
+        if not chance or not encounter_tables().monsters:
+            return None
+        rng = self.world.rng.stream("encounter", x, y)
+        return rng if rng.random() < chance else None
+
+    def has_encounter(self, x: int, y: int, terrain: str) -> bool:
+        """Whether spawn() would place monsters in the room, without drawing them."""
+        return self._roll(x, y, terrain) is not None
+
+    def spawn(self, x: int, y: int, terrain: str, complex_size: int = 1) -> List[Monster]:
+        rng = self._roll(x, y, terrain)
+        if rng is None:
+            return []
+        tables = encounter_tables()
+        cr = self.target_cr(complex_size)
+        return [tables.draw(terrain, cr, rng) for _ in range(rng.randint(1, MAX_GROUP))]
@@ -0,0 +1,57 @@
+import base64
+import logging
+import zlib
+from typing import Dict, Iterable, Tuple
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+class ExploredMap:
+    """One bit per world tile recording whether a character has seen it.
+
+    Bits are packed row-major, eight tiles to a byte (128 KiB for a 1024x1024
+    world), so marking and testing a tile is O(1). Saves store the bytes
+    zlib-compressed and base64-encoded; explored areas are contiguous, so that
+    is a few kilobytes even for large worlds.
+    """
+
+    def __init__(self, width: int, height: int):
+        self.width = width
+        self.height = height
+        self.bits = bytearray((width * height + 7) // 8)
+
+    def is_explored(self, x: int, y: int) -> bool:
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            return False
+        index = y * self.width + x
+        return bool(self.bits[index >> 3] & (0x80 >> (index & 7)))
+
+    def mark(self, x: int, y: int):
+        index = y * self.width + x
+        self.bits[index >> 3] |= 0x80 >> (index & 7)
+
+    def mark_all(self, tiles: Iterable[Tuple[int, int]]):
+        bits, width = self.bits, self.width
+        for x, y in tiles:
+            index = y * width + x
+            bits[index >> 3] |= 0x80 >> (index & 7)
+
+    def count(self) -> int:
+        return int(np.unpackbits(np.frombuffer(self.bits, dtype=np.uint8)).sum())
+
+    def to_dict(self) -> Dict:
+        return {
+            "width": self.width,
+            "height": self.height,
+            "bits": base64.b64encode(zlib.compress(bytes(self.bits), 9)).decode("ascii")
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "ExploredMap":
+        explored = cls(data["width"], data["height"])
+        bits = zlib.decompress(base64.b64decode(data["bits"]))
+        if len(bits) != len(explored.bits):
+            raise ValueError(f"Explored map holds {len(bits)} bytes, expected {len(explored.bits)}")
+        explored.bits[:] = bits
+        return explored
@@ -0,0 +1,151 @@
+import logging
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Dict, FrozenSet, Hashable, Sequence, Tuple
+import numpy as np
+from dnd_adventure.terrain_engine import TERRAIN_TYPES
+
+if TYPE_CHECKING:
+    from dnd_adventure.room import Room
+    from dnd_adventure.world import World
+
+logger = logging.getLogger(__name__)
+
+Point = Tuple[int, int]
+
+OPAQUE_TERRAINS: Tuple[str, ...] = ("mountain",)
+OPAQUE_CELLS: Tuple[str, ...] = ("wall",)  # `type` of local map symbols in graphics.json
+DARK_RADIUS = 1
+DARKVISION_RADIUS = 3
+
+# Transforms from octant-local (column, row) to grid (dx, dy), one per octant
+_OCTANTS = (
+    (1, 0, 0, 1), (0, 1, 1, 0), (0, -1, 1, 0), (-1, 0, 0, 1),
+    (-1, 0, 0, -1), (0, -1, -1, 0), (0, 1, -1, 0), (1, 0, 0, -1)
+)
+
+
+def shadowcast(opaque: np.ndarray, origin: Point, radius: int) -> np.ndarray:
+    """Cells of `opaque` (indexed [y, x]) visible from origin within radius.
+
+    Recursive shadowcasting: each octant is scanned row by row outwards, and
+    every opaque cell narrows the range of slopes the next rows can see.
+    Opaque cells themselves are visible; cells outside the grid block sight.
+    """
+    height, width = opaque.shape
+    blocks = opaque.tolist()
+    visible = [[False] * width for _ in range(height)]
+    ox, oy = origin
+    visible[oy][ox] = True
+    limit = radius * radius + radius
+
+    def cast(row: int, start: float, end: float, xx: int, xy: int, yx: int, yy: int):
+        if start < end:
+            return
+        new_start = start
+        for distance in range(row, radius + 1):
+            blocked = False
+            for dx in range(-distance, 1):
+                dy = -distance
+                left, right = (dx - 0.5) / (dy + 0.5), (dx + 0.5) / (dy - 0.5)
+                if start < right:
+                    continue
+                if end > left:
+                    break
+                x, y = ox + dx * xx + dy * xy, oy + dx * yx + dy * yy
+                inside = 0 <= x < width and 0 <= y < height
+                if inside and dx * dx + dy * dy <= limit:
+                    visible[y][x] = True
+                opaque_cell = not inside or blocks[y][x]
+                if blocked:
+                    if opaque_cell:
+                        new_start = right
+                    else:
+                        blocked = False
+                        start = new_start
+                elif opaque_cell and distance < radius:
+                    blocked = True
+                    cast(distance + 1, start, left, xx, xy, yx, yy)
+                    new_start = right
+            if blocked:
+                break
+
+    for xx, xy, yx, yy in _OCTANTS:
+        cast(1, 1.0, 0.0, xx, xy, yx, yy)
+    return np.array(visible, dtype=bool)
+
+
+def sight_radius(radius: int, lit: bool, darkvision: bool) -> int:
+    """How far one sees: the full radius in light, less in darkness unless one has darkvision."""
+    if lit:
+        return radius
+    return min(radius, DARKVISION_RADIUS if darkvision else DARK_RADIUS)
+
+
+class FieldOfView:
+    """Visibility on the world grid and on local room maps, cached per (position, radius, light).
+
+    World results are dropped when an overlay edit changes terrain within
+    their radius; room maps are static, so their results only age out of the
+    LRU. Moving back and forth between tiles therefore reuses earlier results.
+    """
+
+    def __init__(self, world: "World", cache_size: int = 128):
+        self.world = world
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[Hashable, FrozenSet[Point]]" = OrderedDict()
+        self.opaque_codes = np.array([name in OPAQUE_TERRAINS for name in TERRAIN_TYPES], dtype=bool)
+        world.overlay.listeners.append(self._on_edit)
+
+    def _on_edit(self, x: int, y: int, changed: Dict):
+        if "type" not in changed:
+            return
+        stale = [
+            key for key in self._cache
+            if key[0] == "world" and max(abs(key[1][0] - x), abs(key[1][1] - y)) <= key[2]
+        ]
+        for key in stale:
+            del self._cache[key]
+
+    def _lookup(self, key: Hashable):
+        visible = self._cache.get(key)
+        if visible is not None:
+            self._cache.move_to_end(key)
+        return visible
+
+    def _remember(self, key: Hashable, visible: FrozenSet[Point]) -> FrozenSet[Point]:
+        self._cache[key] = visible
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return visible
+
+    def world_view(self, pos: Point, radius: int = 5, lit: bool = True, darkvision: bool = False) -> FrozenSet[Point]:
+        """World tiles visible from pos; mountains block sight."""
+        radius = sight_radius(radius, lit, darkvision)
+        key = ("world", tuple(pos), radius)
+        visible = self._lookup(key)
+        if visible is not None:
+            return visible
+        x, y = pos
+        x0, y0 = max(0, x - radius), max(0, y - radius)
+        x1, y1 = min(self.world.width, x + radius + 1), min(self.world.height, y + radius + 1)
+        opaque = self.opaque_codes[self.world.terrain_window(x0, y0, x1, y1)]
+        ys, xs = np.nonzero(shadowcast(opaque, (x - x0, y - y0), radius))
+        return self._remember(key, frozenset(zip((xs + x0).tolist(), (ys + y0).tolist())))
+
+    def room_view(self, room: "Room", origin: Point, darkvision: bool = False) -> FrozenSet[Point]:
+        """(column, row) cells of a room's local map layout visible from origin; walls block sight."""
+        map_data = room.kind.map_data
+        if map_data is None:
+            return frozenset()
+        layout: Sequence[str] = map_data["layout"]
+        radius = sight_radius(max(len(layout), len(layout[0])), room.is_lit, darkvision)
+        key = ("room", room.room_type.value, tuple(origin), radius)
+        visible = self._lookup(key)
+        if visible is not None:
+            return visible
+        symbols = map_data["symbols"]
+        opaque = np.array([
+            [symbols.get(char, {}).get("type", "unknown") in OPAQUE_CELLS for char in row] for row in layout
+        ], dtype=bool)
+        ys, xs = np.nonzero(shadowcast(opaque, origin, radius))
+        return self._remember(key, frozenset(zip(xs.tolist(), ys.tolist())))
@@ -10,6 +10,7 @@ from dnd_adventure.save_manager import SaveManager
 from dnd_adventure.ui import UIManager
 from dnd_adventure.world import World
 from dnd_adventure.game_world import GameWorld
+from dnd_adventure.exploration import ExploredMap
 from dnd_adventure.quest_manager import QuestManager
 from dnd_adventure.utils import load_graphics
 import json
@@ -24,8 +25,10 @@ class Game:
         print("DEBUG: Initializing Game...")
         self.player_name = player_name
         self.graphics = load_graphics()
-        # Initialize World
-        self.world = World(seed=None, graphics=self.graphics)
+        self.save_manager = SaveManager()
+        # Initialize World; a saved game continues in the world it was saved in
+        seed = self._get_world_seed_from_save(save_file) if save_file else None
+        self.world = World(seed=seed, graphics=self.graphics)
         # Initialize classes
         classes_path = os.path.join(os.path.dirname(__file__), 'data', 'classes.json')
         logger.debug(f"Loading classes from {classes_path}...")
@@ -56,7 +59,21 @@ class Game:
         self.combat_manager = CombatManager(self)
         themes_dir = os.path.join(os.path.dirname(__file__), 'data', 'themes')
         self.lore_manager = LoreManager(themes_dir)
-        self.save_manager = SaveManager()
+        self.explored = ExploredMap(self.world.width, self.world.height)
+        if save_file:
+            try:
+                saved = self.save_manager.load_game(save_file)
+                if saved.get("world_key") == self.world.cache_key:
+                    self.world.overlay.replay(saved.get("world_edits", []))
+                elif saved.get("world_edits"):
+                    logger.warning(f"Save {save_file} was made in another world, not replaying its world edits")
+                self.combat_manager.rng.counter = saved.get("combat_rng", 0)
+                self.game_world.load_room_state(saved.get("rooms", {}))
+                self.game_world.load_cleared(saved.get("cleared", []))
+                if "explored" in saved:
+                    self.explored = ExploredMap.from_dict(saved["explored"])
+            except Exception as e:
+                logger.error(f"Failed to restore world edits, combat rolls, room state and exploration from save {save_file}: {e}")
         self.ui_manager = UIManager(self)
         # Display lore screen
         self.ui_manager.display_lore_screen(theme)
@@ -68,10 +85,12 @@ class Game:
         self.previous_menu = None
         self.commands = [
             "look", "lore", "attack", "cast", "rest", "talk",
-            "quest list", "quest start", "quest complete", "save", "quit", "exit", "character"
+            "quest list", "quest start", "quest complete", "save", "quit", "exit", "character",
+            "travel", "overview", "country"
         ]
         self.current_map = None
         self.last_world_pos = self.player_pos
+        self.explore()
         self.message = ""
         self.last_enter_time = 0
         self.last_key_time = 0.0
@@ -93,6 +112,18 @@ class Game:
             logger.error(f"Failed to load theme from save {save_file}: {e}")
             return "fantasy"
 
+    def _get_world_seed_from_save(self, save_file: str) -> Optional[int]:
+        """Extract the world seed from save file; None (a new world) if it has none."""
+        try:
+            seed = self.save_manager.load_game(save_file).get("world_seed")
+        except Exception as e:
+            logger.error(f"Failed to load world seed from save {save_file}: {e}")
+            seed = None
+        if seed is None:
+            logger.warning(f"Save {save_file} has no world seed, generating a new world")
+            print(f"{Fore.YELLOW}This save does not record its world; a new world will be generated.{Style.RESET_ALL}")
+        return seed
+
     def _get_starting_room(self) -> str:
         """Start in a random civilization capital, overriding world.py's dungeon."""
         if self.world_state.civilizations:
@@ -117,6 +148,49 @@ class Game:
             logger.error(f"Error listing save files: {e}")
             return []
 
+    def explore(self):
+        """Mark every world tile in sight of the player as explored."""
+        room = self.game_world.rooms.get(f"{self.last_world_pos[0]},{self.last_world_pos[1]}")
+        self.explored.mark_all(self.world.fov.world_view(
+            self.last_world_pos, lit=room.is_lit if room else True, darkvision=getattr(self.player, "has_darkvision", False)
+        ))
+
+    def travel(self, target: str):
+        """Walk the world map along the cheapest path to `x,y` or `nearest <terrain>`, stopping at encounters."""
+        if target.startswith("nearest "):
+            terrain = target.split(maxsplit=1)[1]
+            goal = self.world.terrain_index.nearest(terrain, self.last_world_pos)
+            if goal is None:
+                print(f"{Fore.YELLOW}No {terrain} found.{Style.RESET_ALL}")
+                return
+        else:
+            try:
+                x, y = (int(part) for part in target.split(","))
+                goal = (x, y)
+            except ValueError:
+                print(f"{Fore.RED}Use 'travel <x>,<y>' or 'travel nearest <terrain>'.{Style.RESET_ALL}")
+                return
+        path = self.world.pathfinder.find_path(self.last_world_pos, goal)
+        if path is None:
+            print(f"{Fore.YELLOW}There is no way to reach {goal} from here.{Style.RESET_ALL}")
+            logger.debug(f"No path from {self.last_world_pos} to {goal}")
+            return
+        room = self.game_world.rooms.get(self.current_room) if self.current_room else None
+        for position in path[1:]:
+            self.last_world_pos = position
+            room = self.game_world.rooms.get(f"{position[0]},{position[1]}")
+            self.current_room = f"{position[0]},{position[1]}" if room is not None else None
+            self.explore()
+            if room and room.monsters:
+                print(f"{Fore.RED}Your journey is interrupted at {position} by {room.monsters[0].name}!{Style.RESET_ALL}")
+                logger.debug(f"Travel to {goal} stopped by an encounter at {position}")
+                break
+        else:
+            print(f"{Fore.GREEN}You arrive at {goal} after {len(path) - 1} steps.{Style.RESET_ALL}")
+        # Off dungeons and castles the world map is shown rather than a room layout
+        self.current_map = room.room_type.value if room is not None and room.room_type.value in self.graphics["maps"] else None
+        self.ui_manager.display_current_map()
+
     def handle_command(self, cmd: str):
         self.message = ""
         logger.debug(f"Handling command: {cmd}")
@@ -149,7 +223,7 @@ class Game:
         elif cmd.startswith("quest start "):
             try:
                 quest_id = int(cmd.split()[-1])
-                self.quest_manager.start_quest(quest_id)
+                self.quest_manager.start_quest(quest_id, self.last_world_pos)
             except ValueError:
                 print(f"{Fore.RED}Invalid quest ID. Use 'quest start <number>'.{Style.RESET_ALL}")
                 logger.warning(f"Invalid quest ID: {cmd}")
@@ -160,7 +234,13 @@ class Game:
             save_data = self.player.to_dict()
             save_data["current_room"] = self.current_room
             save_data["player_pos"] = list(self.last_world_pos)
-            save_data["world_seed"] = None
+            save_data["world_seed"] = self.world.seed
+            save_data["world_key"] = self.world.cache_key
+            save_data["world_edits"] = self.world.overlay.entries()
+            save_data["combat_rng"] = self.combat_manager.rng.counter
+            save_data["rooms"] = self.game_world.save_room_state()
+            save_data["cleared"] = self.game_world.cleared_keys()
+            save_data["explored"] = self.explored.to_dict()
             self.save_manager.save_game(save_data, f"{self.player_name.lower().replace(' ', '_')}_{int(time.time())}.save")
         elif cmd in ["quit", "exit"]:
             self.running = False
@@ -168,15 +248,39 @@ class Game:
         elif cmd in ["north", "south", "east", "west", "n", "s", "e"]:
             print(f"{Fore.RED}Movement is controlled with arrow keys or WASD only.{Style.RESET_ALL}")
             logger.debug(f"Attempted movement command: {cmd}")
+        elif cmd == "overview" or cmd.startswith("overview "):
+            arg = cmd[len("overview"):].strip()
+            if arg and not arg.isdigit():
+                print(f"{Fore.RED}Use 'overview' or 'overview <level>'.{Style.RESET_ALL}")
+            else:
+                print(self.world.display_overview(self.last_world_pos, level=int(arg) if arg else None))
+        elif cmd == "country" or cmd.startswith("country "):
+            name = cmd[len("country"):].strip()
+            country = self.world.country_table.find(name) if name else self.world.country_table.at(*self.last_world_pos)
+            if country:
+                terrain = ", ".join(f"{kind} {count * 100 // country.area}%" for kind, count in sorted(country.terrain.items(), key=lambda item: -item[1]))
+                neighbours = ", ".join(self.world.country_table.get(other).name for other in country.neighbours) or "none"
+                print(f"{Fore.CYAN}{country.name}: capital {country.capital}, {country.area} tiles ({terrain}){Style.RESET_ALL}")
+                print(f"{Fore.CYAN}Border tiles: {country.border_tiles}. Neighbours: {neighbours}{Style.RESET_ALL}")
+            else:
+                print(f"{Fore.YELLOW}No such country.{Style.RESET_ALL}")
+        elif cmd.startswith("travel "):
+            self.travel(cmd[len("travel "):].strip())
         elif cmd == "help":
             print(f"{Fore.YELLOW}Available commands: {', '.join(self.commands)}{Style.RESET_ALL}")
             logger.debug("Displayed help commands")
         elif cmd == "debug":
             self.debug_mode = not self.debug_mode
             print(f"Debug mode: {'ON' if self.debug_mode else 'OFF'}")
+        elif cmd.startswith("find ") and self.debug_mode:
+            terrain = cmd.split(maxsplit=1)[1]
+            target = self.world.terrain_index.nearest(terrain, self.last_world_pos)
+            if target:
+                print(f"Nearest {terrain}: {target}")
+            else:
+                print(f"{Fore.YELLOW}No {terrain} found.{Style.RESET_ALL}")
         elif cmd == "clear path" and self.debug_mode:
-            tile_key = "101,96"
-            self.world.map["locations"][tile_key] = {"type": "forest"}
+            self.world.edit_tile(101, 96, type="forest")
             print("Path cleared at (101, 96)")
         elif cmd == "character":
             self.show_status = True
@@ -1,34 +1,190 @@
-from typing import Dict
+import logging
+from collections import OrderedDict
+from collections.abc import MutableMapping
+from typing import Callable, Dict, Iterator, List, Optional, Set, Tuple
+import numpy as np
+from dnd_adventure.encounters import EncounterSpawner
 from dnd_adventure.room import Room, RoomType
+from dnd_adventure.room_state import RoomStateStore
 from dnd_adventure.world import World
 
+logger = logging.getLogger(__name__)
+
+ROOM_TERRAINS = {"dungeon": RoomType.DUNGEON, "castle": RoomType.CASTLE}
+
+
+class LazyRoomMap(MutableMapping):
+    """Room lookup by "x,y" id that builds rooms on first access.
+
+    A room for a dungeon or castle tile is fully described by the world, so
+    only the most recently used `max_rooms` are kept as Room objects; older
+    ones are dropped and rebuilt when asked for again. Rooms the player has
+    changed (visited, fought in, looted, ...) are never dropped, and rooms
+    assigned explicitly (e.g. temporary encounter rooms) are kept as given.
+    """
+
+    def __init__(self, world: World, build: Callable[[int, int], Optional[Room]], max_rooms: int = 256):
+        self.world = world
+        self.build = build
+        self.max_rooms = max_rooms
+        self._cache: "OrderedDict[str, Room]" = OrderedDict()
+        self._retained: Dict[str, Room] = {}
+        self._deleted: Set[str] = set()
+
+    def _coords(self, room_id: str):
+        try:
+            x, y = (int(part) for part in room_id.split(","))
+        except (AttributeError, ValueError):
+            return None
+        if room_id in self._deleted or not self.world.chunks.in_bounds(x, y):
+            return None
+        return x, y
+
+    def __getitem__(self, room_id: str) -> Room:
+        room = self._retained.get(room_id)
+        if room is not None:
+            return room
+        room = self._cache.get(room_id)
+        if room is not None:
+            self._cache.move_to_end(room_id)
+            return room
+        coords = self._coords(room_id)
+        room = self.build(*coords) if coords else None
+        if room is None:
+            raise KeyError(room_id)
+        self._cache[room_id] = room
+        while len(self._cache) > self.max_rooms:
+            self._evict()
+        return room
+
+    def _evict(self):
+        room_id, room = self._cache.popitem(last=False)
+        if not room.is_pristine():
+            self._retained[room_id] = room
+
+    def __setitem__(self, room_id: str, room: Room):
+        self._cache.pop(room_id, None)
+        self._deleted.discard(room_id)
+        self._retained[room_id] = room
+
+    def __delitem__(self, room_id: str):
+        if room_id not in self:
+            raise KeyError(room_id)
+        self._cache.pop(room_id, None)
+        self._retained.pop(room_id, None)
+        self._deleted.add(room_id)
+
+    def __contains__(self, room_id) -> bool:
+        if room_id in self._retained or room_id in self._cache:
+            return True
+        coords = self._coords(room_id)
+        return coords is not None and self.world.get_location(*coords)["type"] in ROOM_TERRAINS
+
+    def __iter__(self) -> Iterator[str]:
+        """Every room id. Generated ids come from the terrain index, which touches every chunk."""
+        seen = set()
+        for room_id in self._retained:
+            seen.add(room_id)
+            yield room_id
+        for terrain in ROOM_TERRAINS:
+            for x, y in self.world.terrain_index.coords(terrain):
+                room_id = f"{x},{y}"
+                if room_id not in seen and room_id not in self._deleted:
+                    yield room_id
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def resident(self) -> int:
+        return len(self._cache) + len(self._retained)
+
+    def modified(self) -> Iterator[Tuple[str, Room, Tuple[int, int]]]:
+        """Resident world rooms that are no longer pristine, with their coordinates."""
+        for rooms in (self._retained, self._cache):
+            for room_id, room in rooms.items():
+                coords = self._coords(room_id)
+                if coords is not None and not room.is_pristine():
+                    yield room_id, room, coords
+
+    def forget(self, room_id: str):
+        """Drop a resident room so the next lookup builds it afresh."""
+        self._cache.pop(room_id, None)
+        self._retained.pop(room_id, None)
+
+
 class GameWorld:
-    def __init__(self, world: World):
+    def __init__(self, world: World, max_rooms: int = 256):
         self.world = world
-        self.rooms: Dict[str, Room] = {}
-        self.generate_dungeons_and_castles()
-
-    def generate_dungeons_and_castles(self):
-        map_data = self.world.map
-        width, height = map_data["width"], map_data["height"]
-        for y in range(height):
-            for x in range(width):
-                tile = self.world.get_location(x, y)
-                if tile["type"] in ["dungeon", "castle"]:
-                    room_id = f"{x},{y}"
-                    description = f"A dark {tile['type']} room at ({x},{y}) in {tile['name']}"
-                    exits = {}
-                    for direction, (dx, dy) in [("north", (0, 1)), ("south", (0, -1)), ("east", (1, 0)), ("west", (-1, 0))]:
-                        new_x, new_y = x + dx, y + dy
-                        if 0 <= new_x < width and 0 <= new_y < height:
-                            new_tile = self.world.get_location(new_x, new_y)
-                            if new_tile["type"] == tile["type"]:
-                                exits[direction] = f"{new_x},{new_y}"
-                    # Use Room with RoomType enum
-                    self.rooms[room_id] = Room(
-                        room_id=int(room_id.replace(",", "")),
-                        name=tile["name"],
-                        description=description,
-                        room_type=RoomType.DUNGEON if tile["type"] == "dungeon" else RoomType.CASTLE,
-                        exits=exits
-                    )
\ No newline at end of file
+        self.room_state = RoomStateStore()
+        self.encounters = EncounterSpawner(world)
+        self.rooms = LazyRoomMap(world, self._materialize, max_rooms=max_rooms)
+
+    def get_room(self, room_id: str) -> Optional[Room]:
+        return self.rooms.get(room_id)
+
+    def build_room(self, x: int, y: int) -> Optional[Room]:
+        """Build the Room for a dungeon or castle tile, or None for any other tile."""
+        graph = self.world.complexes.graph
+        node = graph.node_at(x, y)
+        if node is None:
+            return None
+        tile = self.world.get_location(x, y)
+        room = Room(
+            room_id=int(f"{x}{y}"),
+            name=tile["name"],
+            description=None,  # formatted from the room kind's template on demand
+            room_type=ROOM_TERRAINS[tile["type"]],
+            exits=graph.exits(node),
+            position=(x, y)
+        )
+        monsters = self.encounters.spawn(x, y, tile["type"], graph.size(graph.complex_of(node)))
+        room.stock(monsters)
+        if not monsters:
+            graph.mark_cleared(node)  # nothing to fight here
+        return room
+
+    def _materialize(self, x: int, y: int) -> Optional[Room]:
+        room = self.build_room(x, y)
+        return None if room is None else self.room_state.restore(f"{x},{y}", room)
+
+    def save_room_state(self) -> Dict[str, Dict]:
+        """Compact deltas of every room that differs from its generated baseline."""
+        rooms = ((room_id, room, self.build_room(*coords)) for room_id, room, coords in self.rooms.modified())
+        return self.room_state.dump(rooms)
+
+    def load_room_state(self, data: Dict[str, Dict]):
+        """Queue saved deltas; each is applied when its room is next built."""
+        self.room_state.load(data)
+        for room_id in self.room_state.pending:
+            self.rooms.forget(room_id)
+
+    def complex_at(self, room_id: str) -> Optional[int]:
+        """Id of the multi-tile complex a room belongs to, if it is a dungeon or castle room."""
+        try:
+            x, y = (int(part) for part in room_id.split(","))
+        except (AttributeError, ValueError):
+            return None
+        node = self.world.complexes.graph.node_at(x, y)
+        return None if node is None else self.world.complexes.graph.complex_of(node)
+
+    def mark_cleared(self, room_id: str) -> Optional[int]:
+        """Record a room as cleared; returns its complex id if that completes the whole complex."""
+        complex_id = self.complex_at(room_id)
+        if complex_id is None:
+            return None
+        graph = self.world.complexes.graph
+        x, y = (int(part) for part in room_id.split(","))
+        graph.mark_cleared(graph.node_at(x, y))
+        # Rooms of the complex that were never built count as cleared if they hold no encounter
+        terrain = graph.terrain_of(complex_id)
+        for node in graph.nodes_in(complex_id).tolist():
+            if not graph.cleared[node] and not self.encounters.has_encounter(int(graph.xs[node]), int(graph.ys[node]), terrain):
+                graph.mark_cleared(node)
+        return complex_id if graph.is_cleared(complex_id) else None
+
+    def cleared_keys(self) -> List[int]:
+        """Tile keys (y * width + x) of the rooms marked cleared, for saves."""
+        return self.world.complexes.cleared_keys().tolist()
+
+    def load_cleared(self, keys: List[int]):
+        self.world.complexes.restore_cleared(np.array(keys, dtype=np.int64))
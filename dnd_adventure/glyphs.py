@@ -0,0 +1,88 @@
+import logging
+from typing import Dict, Iterable, List, Tuple
+from colorama import Fore, Style
+from dnd_adventure.terrain_engine import TERRAIN_TYPES
+
+logger = logging.getLogger(__name__)
+
+# A glyph is an (ANSI color code, symbol) pair; Style.RESET_ALL stands for the terminal default.
+Glyph = Tuple[str, str]
+
+COLORS: Dict[str, str] = {
+    "gray": Fore.LIGHTBLACK_EX,
+    "dark_green": Fore.GREEN,
+    "green": Fore.GREEN,
+    "light_green": Fore.LIGHTGREEN_EX,
+    "light_green_ex": Fore.LIGHTGREEN_EX,
+    "blue": Fore.BLUE,
+    "light_blue_ex": Fore.LIGHTBLUE_EX,
+    "cyan": Fore.CYAN,
+    "light_cyan_ex": Fore.LIGHTCYAN_EX,
+    "yellow": Fore.YELLOW,
+    "light_yellow_ex": Fore.LIGHTYELLOW_EX,
+    "red": Fore.RED,
+    "light_red_ex": Fore.LIGHTRED_EX,
+    "brown": Fore.LIGHTRED_EX,
+    "magenta": Fore.MAGENTA,
+    "light_magenta_ex": Fore.LIGHTMAGENTA_EX,
+    "light_black_ex": Fore.LIGHTBLACK_EX,
+    "white": Fore.WHITE,
+    "light_white_ex": Fore.LIGHTWHITE_EX,
+    "black": Fore.BLACK
+}
+
+PLAYER: Glyph = (Fore.RED, "@")
+BLANK: Glyph = (Style.RESET_ALL, " ")
+UNKNOWN = {"symbol": "?", "color": "white"}
+
+
+def compile_glyph(entry: Dict, where: str) -> Glyph:
+    symbol, color = entry.get("symbol", "?"), entry.get("color", "white")
+    code = COLORS.get(color)
+    if code is None:
+        logger.warning(f"Unsupported color '{color}' for symbol '{symbol}' in {where}, using the default color")
+        code = Style.RESET_ALL
+    return code, symbol
+
+
+def render_row(glyphs: Iterable[Glyph]) -> str:
+    """Join glyphs into one line, emitting a color code only where the color changes."""
+    parts: List[str] = []
+    current = Style.RESET_ALL
+    for color, symbol in glyphs:
+        if color != current:
+            parts.append(color)
+            current = color
+        parts.append(symbol)
+    if current != Style.RESET_ALL:
+        parts.append(Style.RESET_ALL)
+    return "".join(parts)
+
+
+class GlyphTable:
+    """The symbols of graphics.json compiled once into glyphs.
+
+    `terrain` and `dimmed` (for explored tiles out of sight) are indexed by
+    terrain code, `structures` by structure name and `maps[name]` by layout
+    character, so rendering is a table lookup per cell.
+    """
+
+    def __init__(self, graphics: Dict):
+        terrains = graphics.get("terrains", {})
+        self.terrain: List[Glyph] = [
+            compile_glyph(terrains.get(name, UNKNOWN), f"terrain {name}") for name in TERRAIN_TYPES
+        ]
+        self.dimmed: List[Glyph] = [(Fore.LIGHTBLACK_EX, symbol) for _, symbol in self.terrain]
+        self.structures: Dict[str, Glyph] = {
+            name: compile_glyph(entry, f"structure {name}") for name, entry in graphics.get("structures", {}).items()
+        }
+        self.maps: Dict[str, Dict[str, Glyph]] = {
+            map_name: {
+                char: compile_glyph(entry, f"{map_name} map") for char, entry in map_data.get("symbols", {}).items()
+            }
+            for map_name, map_data in graphics.get("maps", {}).items()
+        }
+
+    def map_glyph(self, map_name: str, char: str) -> Glyph:
+        """Glyph for a local map character; characters without a symbol entry are drawn as-is."""
+        return self.maps.get(map_name, {}).get(char, (Fore.WHITE, char))
@@ -0,0 +1,147 @@
+import logging
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+import numpy as np
+from dnd_adventure.terrain_engine import TERRAIN_TYPES, TERRAIN_CODES
+
+if TYPE_CHECKING:
+    from dnd_adventure.tile_store import TileStore
+    from dnd_adventure.world import World
+
+logger = logging.getLogger(__name__)
+
+
+class TerrainIndex:
+    """Tile positions of one block grouped by terrain code.
+
+    `order` holds the block's flat (row-major) tile indices sorted by terrain and,
+    within a terrain, by position; `offsets[code]:offsets[code + 1]` is the slice
+    for one terrain. Built with one stable argsort, it costs two or four bytes per tile.
+    """
+
+    def __init__(self, tiles: "TileStore"):
+        self.x0 = tiles.x0
+        self.y0 = tiles.y0
+        self.width = tiles.width
+        flat = tiles.terrain.ravel()
+        index_dtype = np.uint16 if flat.size <= np.iinfo(np.uint16).max + 1 else np.uint32
+        self.order = np.argsort(flat, kind="stable").astype(index_dtype)
+        counts = np.bincount(flat, minlength=len(TERRAIN_TYPES))
+        self.offsets = np.concatenate([[0], np.cumsum(counts)])
+
+    def positions(self, code: int) -> np.ndarray:
+        return self.order[self.offsets[code]:self.offsets[code + 1]]
+
+    def count(self, code: int) -> int:
+        return int(self.offsets[code + 1] - self.offsets[code])
+
+    def coords(self, code: int) -> Tuple[np.ndarray, np.ndarray]:
+        """World (xs, ys) of every tile with this terrain, in row-major order."""
+        positions = self.positions(code).astype(np.int64)
+        return self.x0 + positions % self.width, self.y0 + positions // self.width
+
+
+class WorldLocationIndex:
+    """Terrain lookups over a World, built lazily per chunk and aware of overlay edits."""
+
+    def __init__(self, world: "World"):
+        self.world = world
+        self.chunks = world.chunks
+
+    def _code(self, terrain: str) -> Optional[int]:
+        code = TERRAIN_CODES.get(terrain)
+        if code is None:
+            logger.debug(f"No terrain type '{terrain}' to look up")
+        return code
+
+    def _edited(self) -> Dict[Tuple[int, int], str]:
+        return {key: edit["type"] for key, edit in self.world.overlay.items() if "type" in edit}
+
+    def _chunk_coords(self, cx: int, cy: int, code: int, edited: Dict[Tuple[int, int], str], terrain: str) -> Tuple[np.ndarray, np.ndarray]:
+        xs, ys = self.chunks.get_chunk(cx, cy).terrain_index.coords(code)
+        if not edited:
+            return xs, ys
+        x0, y0, w, h = self.chunks.chunk_bounds(cx, cy)
+        changed = {(x, y): kind for (x, y), kind in edited.items() if x0 <= x < x0 + w and y0 <= y < y0 + h}
+        if not changed:
+            return xs, ys
+        keep = np.array([changed.get(key, terrain) == terrain for key in zip(xs.tolist(), ys.tolist())], dtype=bool)
+        xs, ys = xs[keep], ys[keep]
+        present = set(zip(xs.tolist(), ys.tolist()))
+        added = [key for key, kind in changed.items() if kind == terrain and key not in present]
+        if added:
+            xs = np.concatenate([xs, np.array([x for x, _ in added], dtype=np.int64)])
+            ys = np.concatenate([ys, np.array([y for _, y in added], dtype=np.int64)])
+        return xs, ys
+
+    def first(self, terrain: str) -> Optional[Tuple[int, int]]:
+        """First tile of a terrain in row-major (y, then x) order, scanning one chunk row at a time."""
+        code = self._code(terrain)
+        if code is None:
+            return None
+        edited = self._edited()
+        for cy in range(self.chunks.chunks_y):
+            best = None
+            for cx in range(self.chunks.chunks_x):
+                xs, ys = self._chunk_coords(cx, cy, code, edited, terrain)
+                if len(xs):
+                    i = int(np.lexsort((xs, ys))[0])
+                    candidate = (int(ys[i]), int(xs[i]))
+                    if best is None or candidate < best:
+                        best = candidate
+            if best is not None:
+                return best[1], best[0]
+        return None
+
+    def nearest(self, terrain: str, position: Tuple[int, int], max_radius: Optional[int] = None) -> Optional[Tuple[int, int]]:
+        """Closest tile of a terrain (Euclidean), searching outward in rings of chunks."""
+        code = self._code(terrain)
+        if code is None:
+            return None
+        edited = self._edited()
+        size = self.chunks.chunk_size
+        px, py = position
+        pcx, pcy = px // size, py // size
+        best, best_distance = None, None
+        max_ring = max(self.chunks.chunks_x, self.chunks.chunks_y)
+        if max_radius is not None:
+            max_ring = min(max_ring, max_radius // size + 1)
+        for ring in range(max_ring + 1):
+            # Every tile in this ring is at least (ring - 1) * size + 1 away along one axis
+            if best_distance is not None and ring > 0 and best_distance <= ((ring - 1) * size + 1) ** 2:
+                break
+            for cx, cy in self._ring(pcx, pcy, ring):
+                xs, ys = self._chunk_coords(cx, cy, code, edited, terrain)
+                if not len(xs):
+                    continue
+                distances = (xs - px) ** 2 + (ys - py) ** 2
+                i = int(np.argmin(distances))
+                if best_distance is None or distances[i] < best_distance:
+                    best, best_distance = (int(xs[i]), int(ys[i])), int(distances[i])
+        if best is not None and max_radius is not None and best_distance > max_radius ** 2:
+            return None
+        return best
+
+    def _ring(self, cx: int, cy: int, ring: int) -> List[Tuple[int, int]]:
+        cells = []
+        for y in range(cy - ring, cy + ring + 1):
+            for x in range(cx - ring, cx + ring + 1):
+                if max(abs(x - cx), abs(y - cy)) != ring:
+                    continue
+                if 0 <= x < self.chunks.chunks_x and 0 <= y < self.chunks.chunks_y:
+                    cells.append((x, y))
+        return cells
+
+    def coords(self, terrain: str) -> List[Tuple[int, int]]:
+        """Every tile of a terrain in the world. Touches (and may generate) every chunk."""
+        code = self._code(terrain)
+        if code is None:
+            return []
+        edited = self._edited()
+        found = []
+        for cx, cy in self.chunks.iter_chunk_coords():
+            xs, ys = self._chunk_coords(cx, cy, code, edited, terrain)
+            found.extend(zip(xs.tolist(), ys.tolist()))
+        return found
+
+    def count(self, terrain: str) -> int:
+        return len(self.coords(terrain))
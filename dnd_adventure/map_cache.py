@@ -0,0 +1,120 @@
+import json
+import logging
+import os
+import pickle
+import shutil
+from typing import Any, Dict, Optional
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+CACHE_FORMAT = 1
+HEADER_PREFIX = b"DNDMAP "
+DEFAULT_MAX_WORLDS = 8
+
+
+class MapCache:
+    """On-disk cache of generated map data, one directory per world key.
+
+    A world key combines the seed, map dimensions, generator version and biome
+    table hash (see MapGenerator.cache_key), so worlds never share entries. Every
+    entry starts with a one-line JSON header; it is checked before the payload is
+    unpickled, so stale or foreign entries are rejected cheaply. Large arrays
+    are stored beside them as .npy files and memory-mapped on load; the pickled
+    entry that describes an array is what gets validated.
+
+    Only the `max_worlds` most recently used world directories are kept (use is
+    recorded by touch()); older ones are deleted, so a new game per session
+    does not fill the disk. Everything here is derived from the world key and
+    can be generated again; edits made in play are kept in saves, not here.
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None, max_worlds: int = DEFAULT_MAX_WORLDS):
+        self.cache_dir = cache_dir or os.path.join("dnd_adventure", "map_cache")
+        self.max_worlds = max_worlds
+
+    def world_dir(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key)
+
+    def entry_path(self, key: str, name: str) -> str:
+        return os.path.join(self.world_dir(key), f"{name}.cache")
+
+    def world_file_path(self, key: str) -> str:
+        """Path of the memory-mapped base tile file (see WorldFile) for a world key."""
+        return os.path.join(self.world_dir(key), "world.bin")
+
+    def array_path(self, key: str, name: str) -> str:
+        return os.path.join(self.world_dir(key), f"{name}.npy")
+
+    def _header(self, key: str, name: str) -> Dict:
+        return {"format": CACHE_FORMAT, "key": key, "name": name}
+
+    def load(self, key: str, name: str) -> Optional[Any]:
+        path = self.entry_path(key, name)
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, "rb") as f:
+                line = f.readline()
+                header = json.loads(line[len(HEADER_PREFIX):]) if line.startswith(HEADER_PREFIX) else None
+                if header != self._header(key, name):
+                    logger.warning(f"Ignoring stale or incompatible map cache entry {path}: header {header}")
+                    return None
+                return pickle.load(f)
+        except Exception as e:
+            logger.error(f"Failed to load map cache entry {path}: {e}")
+            return None
+
+    def store(self, key: str, name: str, payload: Any):
+        path = self.entry_path(key, name)
+        tmp_path = f"{path}.tmp"
+        try:
+            os.makedirs(self.world_dir(key), exist_ok=True)
+            with open(tmp_path, "wb") as f:
+                f.write(HEADER_PREFIX + json.dumps(self._header(key, name)).encode("utf-8") + b"\n")
+                pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, path)
+            logger.debug(f"Saved map cache entry {path}")
+        except Exception as e:
+            logger.error(f"Failed to save map cache entry {path}: {e}")
+
+    def load_array(self, key: str, name: str) -> Optional[np.ndarray]:
+        """A stored array, memory-mapped read-only, so only the pages used are read."""
+        path = self.array_path(key, name)
+        if not os.path.exists(path):
+            return None
+        try:
+            return np.load(path, mmap_mode="r")
+        except Exception as e:
+            logger.error(f"Failed to load map cache array {path}: {e}")
+            return None
+
+    def store_array(self, key: str, name: str, array: np.ndarray):
+        path = self.array_path(key, name)
+        tmp_path = f"{path}.tmp"
+        try:
+            os.makedirs(self.world_dir(key), exist_ok=True)
+            with open(tmp_path, "wb") as f:
+                np.save(f, array)
+            os.replace(tmp_path, path)
+            logger.debug(f"Saved map cache array {path}")
+        except Exception as e:
+            logger.error(f"Failed to save map cache array {path}: {e}")
+
+    def touch(self, key: str):
+        """Mark a world as just used and delete the least recently used worlds beyond max_worlds."""
+        world_dir = self.world_dir(key)
+        try:
+            os.makedirs(world_dir, exist_ok=True)
+            os.utime(world_dir)
+            others = [entry for entry in os.scandir(self.cache_dir) if entry.is_dir() and entry.name != key]
+        except OSError as e:
+            logger.error(f"Failed to update map cache directory {world_dir}: {e}")
+            return
+        others.sort(key=lambda entry: entry.stat().st_mtime, reverse=True)
+        for entry in others[max(self.max_worlds - 1, 0):]:
+            self.clear(entry.name)
+
+    def clear(self, key: str):
+        shutil.rmtree(self.world_dir(key), ignore_errors=True)
+        logger.info(f"Cleared map cache for {key}")
@@ -1,115 +1,132 @@
-import random
-import os
-import pickle
+import numpy as np
 import logging
-from typing import Dict, List
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterator, List, Optional, Tuple
 from dnd_adventure.paths import get_resource_path
+from dnd_adventure.terrain_engine import TerrainEngine, TERRAIN_TYPES
+from dnd_adventure.rng import RandomStream
+from dnd_adventure.tile_store import TileStore
 
 logger = logging.getLogger(__name__)
 
+# Bump whenever generation output changes for the same seed, so cached worlds are regenerated.
+GENERATOR_VERSION = 4
+
+Region = Tuple[int, int, int, int]
+
+
+def _generate_region_task(task: Tuple[int, Dict, Region, List[Dict]]) -> TileStore:
+    """Process-pool entry point: regions only depend on the seed, biome table and capitals."""
+    seed, biomes, region, countries = task
+    return MapGenerator(seed, biomes).generate_region(*region, countries)
+
+
 class MapGenerator:
-    def __init__(self, seed: int):
+    def __init__(self, seed: int, biomes: Optional[Dict] = None):
         self.seed = seed
-        random.seed(self.seed)
-
-    def load_or_generate_map(self) -> Dict:
-        cache_path = os.path.join("dnd_adventure", "map_cache.pkl")
-        try:
-            with open(cache_path, "rb") as f:
-                cached_map = pickle.load(f)
-            logger.info("Loaded map from cache.")
-            return cached_map
-        except Exception as e:
-            logger.error(f"Failed to load map cache from {cache_path}: {e}. Regenerating map.")
-            new_map = self.generate_map()
-            try:
-                os.makedirs(os.path.dirname(cache_path), exist_ok=True)
-                with open(cache_path, "wb") as f:
-                    pickle.dump(new_map, f)
-                logger.info(f"Saved generated map to cache at {cache_path}.")
-            except Exception as e:
-                logger.error(f"Failed to save map cache to {cache_path}: {e}")
-            return new_map
-
-    def generate_map(self) -> Dict:
-        width, height = 192, 192
-        map_data = {
-            "width": width,
-            "height": height,
-            "locations": [],
-            "countries": []
-        }
-
-        for y in range(height):
-            row = []
-            for x in range(width):
-                terrain = self.generate_terrain(x, y, width, height)
-                row.append({
-                    "x": x,
-                    "y": y,
-                    "type": terrain,
-                    "name": f"{terrain.capitalize()} at ({x},{y})",
-                    "country": None
-                })
-            map_data["locations"].append(row)
-
-        self.assign_countries(map_data)
-        self.ensure_walkable_path(101, 96, map_data)  # Ensure path at player start
-        return map_data
+        self.engine = TerrainEngine(seed, biomes)
+        self.rng = self.engine.rng
+
+    def cache_key(self, width: int, height: int) -> str:
+        """Identify a generated world: same key, same tiles."""
+        return f"seed{self.seed}_{width}x{height}_v{GENERATOR_VERSION}_{self.engine.config_hash}"
+
+    def generate_region(self, x0: int, y0: int, width: int, height: int, countries: List[Dict]) -> TileStore:
+        """Generate the tiles of one rectangular region (a whole map or a single chunk)."""
+        tiles = TileStore.from_terrain(x0, y0, self.engine.generate_region(x0, y0, width, height), len(countries))
+        self.assign_countries(tiles, countries)
+        return tiles
+
+    def generate_regions(self, regions: List[Region], countries: List[Dict], workers: Optional[int] = None) -> Iterator[TileStore]:
+        """Generate many regions, in order, optionally across a process pool.
+
+        Every region is a pure function of the seed, biome table, capitals and its
+        bounds (terrain noise and feature rolls are keyed by world coordinates), so
+        results are bit-identical to generating the same regions serially.
+        """
+        if not workers or workers <= 1 or len(regions) <= 1:
+            for region in regions:
+                yield self.generate_region(*region, countries)
+            return
+        tasks = [(self.seed, self.engine.biomes, region, countries) for region in regions]
+        logger.info(f"Generating {len(regions)} regions across {workers} worker processes")
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            yield from pool.map(_generate_region_task, tasks, chunksize=max(1, len(tasks) // (workers * 4)))
 
     def generate_terrain(self, x: int, y: int, width: int, height: int) -> str:
-        perlin = self.perlin_noise(x / 20.0, y / 20.0, self.seed)
-        elevation = self.perlin_noise(x / 50.0, y / 50.0, self.seed + 1)
-        if elevation > 0.7:
-            return "mountain"
-        elif perlin < 0.2:
-            return random.choice(["river", "lake", "ocean"])
-        elif perlin < 0.4:
-            return "plains"
-        elif perlin < 0.6:
-            return "forest"
-        elif perlin < 0.7:
-            return "dungeon"
-        else:
-            return "castle"
+        return TERRAIN_TYPES[self.engine.generate_region(x, y, 1, 1)[0, 0]]
 
     def perlin_noise(self, x: float, y: float, seed: int) -> float:
-        random.seed(seed + int(x * 1000 + y))
-        return random.random()
+        return float(self.engine.noise_for(seed).fbm(np.float64(x), np.float64(y)))
 
-    def assign_countries(self, map_data: Dict):
-        width, height = map_data["width"], map_data["height"]
-        num_countries = random.randint(3, 6)
+    def generate_countries(self, width: int, height: int) -> List[Dict]:
+        rng = self.rng.stream("countries", width, height)
+        num_countries = rng.randint(3, 6)
         countries = []
         for i in range(num_countries):
-            capital_x, capital_y = random.randint(0, width - 1), random.randint(0, height - 1)
+            capital_x, capital_y = rng.randint(0, width - 1), rng.randint(0, height - 1)
             countries.append({
                 "id": i,
-                "name": self.generate_name(),
+                "name": self.generate_name(self.rng.stream("country-name", i)),
                 "capital": (capital_x, capital_y)
             })
+        return countries
 
-        for y in range(height):
-            for x in range(width):
-                closest_country = min(countries, key=lambda c: (c["capital"][0] - x) ** 2 + (c["capital"][1] - y) ** 2)
-                map_data["locations"][y][x]["country"] = closest_country["id"]
+    def assign_countries(self, tiles: TileStore, countries: List[Dict], block_size: int = 64):
+        """Label every tile with its nearest capital (a Voronoi partition) using array passes.
 
-        map_data["countries"] = countries
+        The region is walked in blocks. For each block, capitals whose nearest
+        possible distance exceeds the best guaranteed distance are pruned, so a
+        block only compares against the handful of capitals that can own it.
+        Ties go to the lower country index, as with the old per-tile min().
+        """
+        if not countries:
+            return
+        capitals = np.array([country["capital"] for country in countries], dtype=np.int64)
+        ids = np.array([country["id"] for country in countries], dtype=tiles.country.dtype)
+        for by in range(0, tiles.height, block_size):
+            for bx in range(0, tiles.width, block_size):
+                x_lo, y_lo = tiles.x0 + bx, tiles.y0 + by
+                x_hi = min(x_lo + block_size, tiles.x0 + tiles.width) - 1
+                y_hi = min(y_lo + block_size, tiles.y0 + tiles.height) - 1
+                near_dx = np.maximum(np.maximum(x_lo - capitals[:, 0], capitals[:, 0] - x_hi), 0)
+                near_dy = np.maximum(np.maximum(y_lo - capitals[:, 1], capitals[:, 1] - y_hi), 0)
+                far_dx = np.maximum(np.abs(capitals[:, 0] - x_lo), np.abs(capitals[:, 0] - x_hi))
+                far_dy = np.maximum(np.abs(capitals[:, 1] - y_lo), np.abs(capitals[:, 1] - y_hi))
+                candidates = np.flatnonzero(near_dx ** 2 + near_dy ** 2 <= (far_dx ** 2 + far_dy ** 2).min())
+                xs = np.arange(x_lo, x_hi + 1, dtype=np.int64)
+                ys = np.arange(y_lo, y_hi + 1, dtype=np.int64)[:, None]
+                block = tiles.country[by:by + len(ys), bx:bx + len(xs)]
+                best = None
+                for index in candidates:
+                    distance = (ys - capitals[index, 1]) ** 2 + (xs - capitals[index, 0]) ** 2
+                    if best is None:
+                        best = distance
+                        block[:] = ids[index]
+                        continue
+                    closer = distance < best
+                    best[closer] = distance[closer]
+                    block[closer] = ids[index]
 
-    def generate_name(self) -> str:
+    def generate_name(self, rng: Optional[RandomStream] = None) -> str:
+        rng = rng or self.rng.stream("world-name")
         prefixes = ["Eldr", "Thal", "Vyr", "Kael", "Drak", "Fyr"]
         suffixes = ["ion", "stead", "moor", "wyn", "gard", "thyr"]
-        return random.choice(prefixes) + random.choice(suffixes)
+        return rng.choice(prefixes) + rng.choice(suffixes)
 
     def ensure_walkable_path(self, x: int, y: int, map_data: Dict) -> None:
         """Ensure at least one adjacent tile is walkable (not impassable like mountain/ocean)."""
         if 0 <= y < map_data["height"] and 0 <= x < map_data["width"]:
             directions = [(0, 1), (0, -1), (1, 0), (-1, 0)]  # North, South, East, West
-            random.shuffle(directions)
-            for dx, dy in directions:
-                new_x, new_y = x + dx, y + dy
-                if 0 <= new_x < map_data["width"] and 0 <= new_y < map_data["height"]:
-                    if map_data["locations"][new_y][new_x]["type"] in ["mountain", "ocean"]:
-                        map_data["locations"][new_y][new_x]["type"] = "plains"
-                        map_data["locations"][new_y][new_x]["name"] = f"Plains at ({new_x},{new_y})"
-                        break
\ No newline at end of file
+            self.rng.stream("walkable-path", x, y).shuffle(directions)
+            neighbours = [
+                (x + dx, y + dy) for dx, dy in directions
+                if 0 <= x + dx < map_data["width"] and 0 <= y + dy < map_data["height"]
+            ]
+            if any(map_data["locations"][ny][nx]["type"] not in ["mountain", "ocean"] for nx, ny in neighbours):
+                return  # already walkable; keeps replayed worlds from collecting extra edits
+            for new_x, new_y in neighbours:
+                tile = map_data["locations"][new_y][new_x]
+                # Replace rather than mutate so the write goes through to the tile store or world overlay
+                map_data["locations"][new_y][new_x] = {**tile, "type": "plains", "name": f"Plains at ({new_x},{new_y})"}
+                break
@@ -0,0 +1,95 @@
+import logging
+from typing import TYPE_CHECKING, Dict, List, Optional
+import numpy as np
+from dnd_adventure.terrain_engine import TERRAIN_TYPES, TERRAIN_CODES
+
+if TYPE_CHECKING:
+    from dnd_adventure.world import World
+
+logger = logging.getLogger(__name__)
+
+
+def downsample(terrain: np.ndarray) -> np.ndarray:
+    """Majority terrain of every 2x2 block; ties go to the lower terrain code.
+
+    Odd edges are padded by repeating the last row/column, so a block is never empty.
+    """
+    height, width = terrain.shape
+    padded = np.pad(terrain, ((0, height % 2), (0, width % 2)), mode="edge")
+    blocks = padded.reshape(padded.shape[0] // 2, 2, padded.shape[1] // 2, 2)
+    counts = np.zeros(blocks.shape[::2] + (len(TERRAIN_TYPES),), dtype=np.uint8)
+    for code in range(len(TERRAIN_TYPES)):
+        counts[..., code] = (blocks == code).sum(axis=(1, 3))
+    return counts.argmax(axis=2).astype(np.uint8)
+
+
+class MapPyramid:
+    """Downsampled copies of the world's terrain for zoomed-out views.
+
+    levels[k] covers the world at 2**k tiles per cell (levels[0] is unused; the
+    world itself is level 0), halving until a level fits in `min_size` cells.
+    Each cell is the majority of the four cells below it. The pyramid of the
+    unedited base tiles is built once per world and cached; overlay edits are
+    replayed onto it on load and applied as they happen, touching one cell per level.
+    """
+
+    def __init__(self, world: "World", min_size: int = 16):
+        self.world = world
+        self.min_size = min_size
+        self._levels: Optional[List[Optional[np.ndarray]]] = None
+        world.overlay.listeners.append(self._on_edit)
+
+    @property
+    def levels(self) -> List[Optional[np.ndarray]]:
+        if self._levels is None:
+            cached = self.world.map_cache.load(self.world.cache_key, "pyramid")
+            if cached is not None and cached["min_size"] == self.min_size:
+                self._levels = cached["levels"]
+            else:
+                self._levels = self.build(self.world.connectivity.terrain(with_edits=False))
+                self.world.map_cache.store(
+                    self.world.cache_key, "pyramid", {"min_size": self.min_size, "levels": self._levels}
+                )
+            # The cached pyramid is of the base tiles; edits are sparse, so replay them cell by cell
+            for (x, y), edit in self.world.overlay.items():
+                if "type" in edit:
+                    self._update(x, y)
+        return self._levels
+
+    def build(self, terrain: np.ndarray) -> List[Optional[np.ndarray]]:
+        levels: List[Optional[np.ndarray]] = [None]
+        current = terrain
+        while max(current.shape) > self.min_size:
+            current = downsample(current)
+            levels.append(current)
+        logger.info(f"Built map pyramid with {len(levels) - 1} levels for {self.world.cache_key}")
+        return levels
+
+    def _on_edit(self, x: int, y: int, changed: Dict):
+        if self._levels is not None and "type" in changed:
+            self._update(x, y)
+
+    def _update(self, x: int, y: int):
+        """Recompute the one cell per level that covers tile (x, y), bottom up."""
+        for level in range(1, len(self._levels)):
+            cx, cy = x >> level, y >> level
+            children = [self._cell(level - 1, 2 * cx + dx, 2 * cy + dy) for dy in (0, 1) for dx in (0, 1)]
+            counts = np.bincount(children, minlength=len(TERRAIN_TYPES))
+            self._levels[level][cy, cx] = int(counts.argmax())
+
+    def _cell(self, level: int, x: int, y: int) -> int:
+        """A cell of `level`, with coordinates clamped to the grid like the padding in downsample."""
+        if level == 0:
+            x, y = min(x, self.world.width - 1), min(y, self.world.height - 1)
+            return TERRAIN_CODES[self.world.get_tile(x, y)["type"]]
+        grid = self._levels[level]
+        return int(grid[min(y, grid.shape[0] - 1), min(x, grid.shape[1] - 1)])
+
+    def level_for(self, max_width: int, max_height: int) -> int:
+        """Finest level that fits in the given number of columns and rows."""
+        levels = self.levels
+        for level in range(1, len(levels)):
+            height, width = levels[level].shape
+            if width <= max_width and height <= max_height:
+                return level
+        return len(levels) - 1
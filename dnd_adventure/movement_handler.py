@@ -1,5 +1,4 @@
 import logging
-from dnd_adventure.utils import load_graphics
 from dnd_adventure.room import RoomType
 
 logger = logging.getLogger(__name__)
@@ -7,7 +6,6 @@ logger = logging.getLogger(__name__)
 class MovementHandler:
     def __init__(self, game):
         self.game = game
-        self.graphics = load_graphics()
         self.directions = {
             'w': (0, -1),  # Up
             's': (0, 1),   # Down
@@ -36,12 +34,12 @@ class MovementHandler:
         if not room:
             logger.error(f"Invalid room: {self.game.current_room}")
             return False
-        map_type = room.room_type.name.lower()  # Convert RoomType enum to string (e.g., 'dungeon')
-        if map_type not in self.graphics['maps']:
-            logger.error(f"Invalid map type: {map_type}")
+        map_data = room.kind.map_data  # shared by every room of this RoomType
+        if map_data is None:
+            logger.error(f"Invalid map type: {room.room_type.value}")
             return False
 
-        map_layout = self.graphics['maps'][map_type]['layout']
+        map_layout = map_data['layout']
         map_height = len(map_layout)
         map_width = len(map_layout[0]) if map_height > 0 else 0
 
@@ -52,7 +50,7 @@ class MovementHandler:
 
         # Check if the new position is passable (not a wall)
         target_symbol = map_layout[new_y][new_x]
-        map_symbols = self.graphics['maps'][map_type]['symbols']
+        map_symbols = map_data['symbols']
         target_type = map_symbols.get(target_symbol, {}).get('type', 'wall')
 
         if target_type == 'wall':
@@ -0,0 +1,59 @@
+import numpy as np
+
+
+def _fade(t: np.ndarray) -> np.ndarray:
+    return t * t * t * (t * (t * 6 - 15) + 10)
+
+
+class GradientNoise:
+    """2D Perlin gradient noise evaluated over whole coordinate arrays.
+
+    The permutation table and gradients come from a private generator seeded with
+    `seed`, so sampling never touches the global `random` state.
+    """
+
+    def __init__(self, seed: int):
+        rng = np.random.default_rng(seed)
+        perm = rng.permutation(256)
+        self.perm = np.concatenate([perm, perm])
+        angles = rng.uniform(0.0, 2.0 * np.pi, 256)
+        self.gradients = np.stack([np.cos(angles), np.sin(angles)], axis=-1)
+        self.octave_offsets = rng.uniform(0.0, 256.0, (16, 2))
+
+    def _dot_gradient(self, ix: np.ndarray, iy: np.ndarray, dx: np.ndarray, dy: np.ndarray) -> np.ndarray:
+        g = self.gradients[self.perm[self.perm[ix] + iy]]
+        return g[..., 0] * dx + g[..., 1] * dy
+
+    def noise(self, xs: np.ndarray, ys: np.ndarray) -> np.ndarray:
+        """Single-octave noise in roughly [-1, 1]."""
+        xs = np.asarray(xs, dtype=np.float64)
+        ys = np.asarray(ys, dtype=np.float64)
+        x_floor = np.floor(xs)
+        y_floor = np.floor(ys)
+        xf = xs - x_floor
+        yf = ys - y_floor
+        xi = x_floor.astype(np.int64) & 255
+        yi = y_floor.astype(np.int64) & 255
+        n00 = self._dot_gradient(xi, yi, xf, yf)
+        n10 = self._dot_gradient(xi + 1, yi, xf - 1, yf)
+        n01 = self._dot_gradient(xi, yi + 1, xf, yf - 1)
+        n11 = self._dot_gradient(xi + 1, yi + 1, xf - 1, yf - 1)
+        u = _fade(xf)
+        v = _fade(yf)
+        nx0 = n00 + u * (n10 - n00)
+        nx1 = n01 + u * (n11 - n01)
+        return (nx0 + v * (nx1 - nx0)) * np.sqrt(2.0)
+
+    def fbm(self, xs: np.ndarray, ys: np.ndarray, octaves: int = 4, lacunarity: float = 2.0, persistence: float = 0.5) -> np.ndarray:
+        """Fractal sum of `octaves` noise layers, in roughly [-1, 1]."""
+        total = np.zeros(np.broadcast(xs, ys).shape, dtype=np.float64)
+        amplitude = 1.0
+        frequency = 1.0
+        max_amplitude = 0.0
+        for octave in range(octaves):
+            offset_x, offset_y = self.octave_offsets[octave % len(self.octave_offsets)]
+            total += amplitude * self.noise(xs * frequency + offset_x, ys * frequency + offset_y)
+            max_amplitude += amplitude
+            amplitude *= persistence
+            frequency *= lacunarity
+        return total / max_amplitude
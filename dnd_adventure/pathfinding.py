@@ -0,0 +1,125 @@
+import heapq
+import logging
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+from dnd_adventure.terrain_engine import TERRAIN_TYPES, TERRAIN_CODES
+from dnd_adventure.walkability import IMPASSABLE
+
+if TYPE_CHECKING:
+    from dnd_adventure.world import World
+
+logger = logging.getLogger(__name__)
+
+Point = Tuple[int, int]
+
+# Cost of stepping onto a tile; impassable terrain (see walkability.IMPASSABLE) has none.
+MOVE_COSTS: Dict[str, float] = {
+    "plains": 1.0,
+    "dungeon": 1.0,
+    "castle": 1.0,
+    "forest": 2.0,
+    "river": 3.0,
+    "lake": 4.0
+}
+
+
+class PathFinder:
+    """A* over the world's passability grid with terrain move costs.
+
+    Terrain is read straight from the chunk arrays (plus overlay edits), never
+    through tile dicts. Recent paths are kept in a bounded LRU; a request whose
+    start lies on a cached path to the same goal reuses that path's tail. The
+    cache is dropped whenever the world overlay changes.
+    """
+
+    def __init__(self, world: "World", cache_size: int = 64, max_expansions: int = 200_000):
+        self.world = world
+        self.cache_size = cache_size
+        self.max_expansions = max_expansions
+        self.costs: List[Optional[float]] = [
+            None if name in IMPASSABLE else MOVE_COSTS.get(name, 1.0) for name in TERRAIN_TYPES
+        ]
+        self.min_cost = min(cost for cost in self.costs if cost is not None)
+        self._cache: "OrderedDict[Tuple[Point, Point], List[Point]]" = OrderedDict()
+        self._cache_version = world.overlay.version
+
+    def step_cost(self, x: int, y: int) -> Optional[float]:
+        edit = self.world.overlay.get(x, y)
+        if edit and "type" in edit:
+            return self.costs[TERRAIN_CODES[edit["type"]]]
+        chunks = self.world.chunks
+        tiles = chunks.get_chunk(x // chunks.chunk_size, y // chunks.chunk_size)
+        return self.costs[tiles.terrain[y - tiles.y0, x - tiles.x0]]
+
+    def _cached(self, start: Point, goal: Point) -> Optional[List[Point]]:
+        if self._cache_version != self.world.overlay.version:
+            self._cache.clear()
+            self._cache_version = self.world.overlay.version
+        path = self._cache.get((start, goal))
+        if path is not None:
+            self._cache.move_to_end((start, goal))
+            return path
+        for (_, cached_goal), cached_path in reversed(self._cache.items()):
+            if cached_goal == goal and start in cached_path:
+                return cached_path[cached_path.index(start):]
+        return None
+
+    def _remember(self, start: Point, goal: Point, path: List[Point]):
+        self._cache[(start, goal)] = path
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    def find_path(self, start: Point, goal: Point) -> Optional[List[Point]]:
+        """Cheapest path from start to goal, both included, or None if there is none."""
+        if not (self.world.chunks.in_bounds(*start) and self.world.chunks.in_bounds(*goal)):
+            return None
+        if start == goal:
+            return [start]
+        if self.step_cost(*goal) is None or not self.world.connectivity.reachable(start, goal):
+            return None
+        path = self._cached(start, goal)
+        if path is not None:
+            return path
+        path = self._search(start, goal)
+        if path is not None:
+            self._remember(start, goal, path)
+        return path
+
+    def _search(self, start: Point, goal: Point) -> Optional[List[Point]]:
+        gx, gy = goal
+        best: Dict[Point, float] = {start: 0.0}
+        came_from: Dict[Point, Point] = {}
+        frontier = [(self.min_cost * (abs(start[0] - gx) + abs(start[1] - gy)), 0.0, start)]
+        expansions = 0
+        while frontier:
+            _, cost, current = heapq.heappop(frontier)
+            if current == goal:
+                path = [current]
+                while current in came_from:
+                    current = came_from[current]
+                    path.append(current)
+                path.reverse()
+                return path
+            if cost > best[current]:
+                continue
+            expansions += 1
+            if expansions > self.max_expansions:
+                logger.warning(f"Gave up searching for a path from {start} to {goal} after {expansions} expansions")
+                return None
+            x, y = current
+            for nx, ny in ((x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1)):
+                if not self.world.chunks.in_bounds(nx, ny):
+                    continue
+                step = self.step_cost(nx, ny)
+                if step is None:
+                    continue
+                new_cost = cost + step
+                if new_cost < best.get((nx, ny), float("inf")):
+                    best[(nx, ny)] = new_cost
+                    came_from[(nx, ny)] = current
+                    estimate = new_cost + self.min_cost * (abs(nx - gx) + abs(ny - gy))
+                    heapq.heappush(frontier, (estimate, new_cost, (nx, ny)))
+        return None
+
+    def path_cost(self, path: List[Point]) -> float:
+        return sum(self.step_cost(x, y) or 0.0 for x, y in path[1:])
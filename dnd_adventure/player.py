@@ -46,6 +46,8 @@ class Player:
             self.stats[stat] = self.stats.get(stat, 10) + value
         for stat, value in subrace_modifiers.items():
             self.stats[stat] = self.stats.get(stat, 10) + value
+        traits = race_data.get("racial_traits", []) + subrace_data.get("racial_traits", [])
+        self.has_darkvision = any("darkvision" in trait.get("name", "").lower() for trait in traits)
 
     def to_dict(self) -> Dict:
         return {
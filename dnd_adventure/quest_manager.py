@@ -47,7 +47,7 @@ class QuestManager:
             status = "Active" if quest in self.active_quests else "Available"
             print(f"[{status}] {quest['id']}: {quest['name']} - {quest['description']}")
 
-    def start_quest(self, quest_id: int):
+    def start_quest(self, quest_id: int, player_pos: Optional[Tuple[int, int]] = None):
         quest = next((q for q in self.quests if q["id"] == quest_id), None)
         if not quest:
             print(f"Quest {quest_id} not found!")
@@ -57,6 +57,11 @@ class QuestManager:
             return
         self.active_quests.append(quest)
         print(f"Started quest: {quest['name']}")
+        objective = quest["objective"]
+        if objective["type"] == "reach" and player_pos is not None:
+            target = self.world.terrain_index.nearest(objective["location_type"], player_pos)
+            if target:
+                print(f"The nearest {objective['location_type']} lies at {target}.")
 
     def complete_quest(self, quest_id: int, player: Character, player_pos: Tuple[int, int], current_room: Optional[str]):
         quest = next((q for q in self.active_quests if q["id"] == quest_id), None)
@@ -0,0 +1,112 @@
+import hashlib
+import random
+from typing import Union
+import numpy as np
+
+_GOLDEN = np.uint64(0x9E3779B97F4A7C15)
+_MIX_1 = np.uint64(0xBF58476D1CE4E5B9)
+_MIX_2 = np.uint64(0x94D049BB133111EB)
+_MASK = (1 << 64) - 1
+
+Key = Union[int, str]
+
+
+def hash_uniform(keys: np.ndarray, salt: int = 0) -> np.ndarray:
+    """Map integer keys to floats in [0, 1) with a splitmix64 finalizer.
+
+    Every key is hashed independently, so the result for a tile never depends on
+    the order in which tiles are generated or on the global `random` state.
+    """
+    with np.errstate(over="ignore"):
+        z = np.asarray(keys, dtype=np.int64).astype(np.uint64)
+        z = z + _GOLDEN * np.uint64(salt + 1)
+        z = (z ^ (z >> np.uint64(30))) * _MIX_1
+        z = (z ^ (z >> np.uint64(27))) * _MIX_2
+        z = z ^ (z >> np.uint64(31))
+    return (z >> np.uint64(11)).astype(np.float64) * (1.0 / (1 << 53))
+
+
+def mix64(value: int) -> int:
+    """Scalar splitmix64 finalizer, bit-identical to the one in hash_uniform."""
+    z = value & _MASK
+    z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & _MASK
+    z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & _MASK
+    return z ^ (z >> 31)
+
+
+def derive_key(seed: int, *parts: Key) -> int:
+    """Fold a seed and any number of int or str parts into one 64-bit key.
+
+    Strings are hashed with sha1 rather than hash(), so keys are stable across
+    processes and Python runs.
+    """
+    key = mix64(seed + 0x9E3779B97F4A7C15)
+    for part in parts:
+        if isinstance(part, str):
+            part = int.from_bytes(hashlib.sha1(part.encode("utf-8")).digest()[:8], "little")
+        key = mix64((key ^ (part & _MASK)) + 0x9E3779B97F4A7C15)
+    return key
+
+
+class RandomStream(random.Random):
+    """A counter-based random.Random: draw n is mix64(key + n * golden ratio).
+
+    Any draw can be recomputed from the key and its index alone, so streams for
+    different purposes or coordinates never interfere and can be consumed in
+    any order or process. All of random.Random's helpers (randint, choice,
+    shuffle, choices, ...) work on top of it.
+    """
+
+    def __init__(self, key: int, counter: int = 0):
+        self.key = key & _MASK
+        self.counter = counter
+        super().__init__()
+
+    def seed(self, a=None, version=2):
+        # random.Random.__init__ calls seed(); the key alone defines the stream.
+        self.counter = getattr(self, "counter", 0)
+
+    def next64(self) -> int:
+        value = mix64(self.key + self.counter * 0x9E3779B97F4A7C15)
+        self.counter += 1
+        return value
+
+    def random(self) -> float:
+        return (self.next64() >> 11) * (1.0 / (1 << 53))
+
+    def getrandbits(self, k: int) -> int:
+        if k <= 0:
+            return 0
+        value, bits = 0, 0
+        while bits < k:
+            value |= self.next64() << bits
+            bits += 64
+        return value & ((1 << k) - 1)
+
+    def getstate(self):
+        return self.key, self.counter
+
+    def setstate(self, state):
+        self.key, self.counter = state
+
+
+class RNGService:
+    """Hands out independent random streams for one world seed.
+
+    A stream is identified by a purpose ("countries", "combat", "loot", ...) and
+    optional coordinates or other keys, e.g. stream("loot", x, y). Asking for
+    the same stream twice starts it from the beginning both times.
+    """
+
+    def __init__(self, seed: int):
+        self.seed = seed
+
+    def stream(self, purpose: str, *keys: Key) -> RandomStream:
+        return RandomStream(derive_key(self.seed, purpose, *keys))
+
+    def salt(self, purpose: str) -> int:
+        """A per-purpose salt for hash_uniform, for vectorized per-tile rolls."""
+        return derive_key(self.seed, purpose) >> 2
+
+    def uniform(self, purpose: str, keys: np.ndarray) -> np.ndarray:
+        return hash_uniform(keys, salt=self.salt(purpose))
@@ -1,9 +1,11 @@
 from enum import Enum
-from typing import Dict, List, Optional, Callable
+from typing import Callable, Dict, List, Optional, Tuple
 import logging
 from dnd_adventure.dnd35e.core.monsters import Monster
 from dnd_adventure.dnd35e.core import Item, Trap, Puzzle, LightSource
 from dnd_adventure.npc import NPC
+from dnd_adventure.room_events import RoomEvent, RoomHooks
+from dnd_adventure.utils import load_graphics
 
 logger = logging.getLogger(__name__)
 
@@ -15,14 +17,91 @@ class RoomType(Enum):
     TEMPLE = "temple"
     CAVE = "cave"
 
+class RoomKind:
+    """Data shared by every room of one RoomType (a flyweight), so rooms only store what differs."""
+
+    __slots__ = ("room_type", "lit_by_default", "description_template", "hooks")
+
+    def __init__(self, room_type: RoomType, lit_by_default: bool, description_template: str):
+        self.room_type = room_type
+        self.lit_by_default = lit_by_default
+        self.description_template = description_template
+        self.hooks = RoomHooks()
+
+    @property
+    def map_data(self) -> Optional[Dict]:
+        """Local map (description, layout, symbols) for this kind from graphics.json, if it has one."""
+        global _graphics
+        if _graphics is None:
+            _graphics = load_graphics()
+        return _graphics.get("maps", {}).get(self.room_type.value)
+
+    def describe(self, name: str, position: Optional[Tuple[int, int]]) -> str:
+        x, y = position if position is not None else ("?", "?")
+        return self.description_template.format(type=self.room_type.value, name=name, x=x, y=y)
+
+
+_graphics: Optional[Dict] = None
+
+ROOM_KINDS: Dict[RoomType, RoomKind] = {
+    RoomType.TOWN: RoomKind(RoomType.TOWN, True, "The streets of {name} at ({x},{y})"),
+    RoomType.DUNGEON: RoomKind(RoomType.DUNGEON, False, "A dark {type} room at ({x},{y}) in {name}"),
+    RoomType.WILDERNESS: RoomKind(RoomType.WILDERNESS, False, "Open wilderness at ({x},{y}) in {name}"),
+    RoomType.CASTLE: RoomKind(RoomType.CASTLE, False, "A dark {type} room at ({x},{y}) in {name}"),
+    RoomType.TEMPLE: RoomKind(RoomType.TEMPLE, True, "A quiet temple at ({x},{y}) in {name}"),
+    RoomType.CAVE: RoomKind(RoomType.CAVE, False, "A damp cave at ({x},{y}) in {name}")
+}
+
+
+def register_hook(room_type: RoomType, event: RoomEvent, handler: Callable):
+    """Call handler(room, *args) on `event` in every room of `room_type`."""
+    ROOM_KINDS[room_type].hooks.add(event, handler)
+
+
+def unregister_hook(room_type: RoomType, event: RoomEvent, handler: Callable):
+    ROOM_KINDS[room_type].hooks.remove(event, handler)
+
+
+def _lazy(slot: str, factory: Callable):
+    """Property for a collection slot that stays None until first used."""
+    def getter(self):
+        value = getattr(self, slot)
+        if value is None:
+            value = factory()
+            setattr(self, slot, value)
+        return value
+
+    def setter(self, value):
+        setattr(self, slot, value)
+
+    return property(getter, setter)
+
+
 class Room:
+    """A location the player can be in.
+
+    Slotted, with type-level data in a shared RoomKind and every collection
+    allocated on first use, so an untouched room is a handful of references.
+    The description is formatted from the kind's template unless one is given.
+
+    Events (see RoomEvent) go to the kind's hooks, then the room's own. Armed
+    traps and the number of active lights are tracked as they change, so
+    entering a room does not rescan its traps and lighting is not recounted.
+    """
+
+    __slots__ = (
+        "room_id", "name", "_description", "kind", "position", "_exits", "_monsters", "_items",
+        "_traps", "_puzzles", "_light_sources", "_npcs", "on_enter", "on_exit", "visited", "is_lit",
+        "_hooks", "_armed_traps", "_active_lights", "_stocked"
+    )
+
     def __init__(
         self,
         room_id: int,
         name: str,
-        description: str,
+        description: Optional[str],
         room_type: RoomType,
-        exits: Dict[str, str],
+        exits: Optional[Dict[str, str]] = None,
         monsters: Optional[List[Monster]] = None,
         items: Optional[List[Item]] = None,
         traps: Optional[List[Trap]] = None,
@@ -31,29 +110,85 @@ class Room:
         npcs: Optional[List[NPC]] = None,
         on_enter: Optional[Callable] = None,
         on_exit: Optional[Callable] = None,
-        visited: bool = False
+        visited: bool = False,
+        position: Optional[Tuple[int, int]] = None
     ):
         self.room_id = room_id
         self.name = name
-        self.description = description
-        self.room_type = room_type
-        self.exits = exits
-        self.monsters = monsters if monsters is not None else []
-        self.items = items if items is not None else []
-        self.traps = traps if traps is not None else []
-        self.puzzles = puzzles if puzzles is not None else []
-        self.light_sources = light_sources if light_sources is not None else []
-        self.npcs = npcs if npcs is not None else []
+        self._description = description
+        self.kind = ROOM_KINDS[room_type]
+        self.position = position
+        self._exits = exits or None
+        self._monsters = monsters
+        self._items = items
+        self._traps = traps
+        self._puzzles = puzzles
+        self._light_sources = light_sources
+        self._npcs = npcs
         self.on_enter = on_enter
         self.on_exit = on_exit
         self.visited = visited
-        self.is_lit = self._determine_initial_lighting()
+        self._hooks: Optional[RoomHooks] = None
+        self._stocked: Optional[Tuple[Tuple[Monster, int], ...]] = None
+        self._armed_traps: Optional[List[Trap]] = None
+        self._active_lights = sum(1 for light in light_sources or () if light.is_active)
+        self.is_lit = self.kind.lit_by_default or self._active_lights > 0
         logger.debug(f"Room initialized: {self.name} (ID: {self.room_id}, Type: {self.room_type.value})")
 
-    def _determine_initial_lighting(self) -> bool:
-        if self.room_type in [RoomType.TOWN, RoomType.TEMPLE]:
-            return True
-        return any(light.is_active for light in self.light_sources)
+    exits = _lazy("_exits", dict)
+    monsters = _lazy("_monsters", list)
+    items = _lazy("_items", list)
+    traps = _lazy("_traps", list)
+    puzzles = _lazy("_puzzles", list)
+    light_sources = _lazy("_light_sources", list)
+    npcs = _lazy("_npcs", list)
+    hooks = _lazy("_hooks", RoomHooks)
+
+    @property
+    def room_type(self) -> RoomType:
+        return self.kind.room_type
+
+    @property
+    def description(self) -> str:
+        if self._description is None:
+            return self.kind.describe(self.name, self.position)
+        return self._description
+
+    @description.setter
+    def description(self, value: str):
+        self._description = value
+
+    def stock(self, monsters: List[Monster]):
+        """Place generated monsters; the room stays pristine until one is hurt, killed or joined."""
+        self._monsters = list(monsters) or None
+        self._stocked = tuple((monster, monster.hit_points) for monster in monsters) or None
+
+    def _monsters_pristine(self) -> bool:
+        monsters = self._monsters or ()
+        stocked = self._stocked or ()
+        return len(monsters) == len(stocked) and all(
+            monster is original and monster.hit_points == hit_points
+            for monster, (original, hit_points) in zip(monsters, stocked)
+        )
+
+    def is_pristine(self) -> bool:
+        """Whether nothing about the room has changed since it was built from its defaults."""
+        return self._monsters_pristine() and not (
+            self.visited or self._items or self._traps or self._puzzles
+            or self._light_sources or self._npcs or self.on_enter or self.on_exit or self._hooks
+        )
+
+    def _emit(self, event: RoomEvent, *args):
+        self.kind.hooks.dispatch(event, self, *args)
+        if self._hooks:
+            self._hooks.dispatch(event, self, *args)
+
+    def _set_lighting(self):
+        is_lit = self.kind.lit_by_default or self._active_lights > 0
+        if is_lit != self.is_lit:
+            self.is_lit = is_lit
+            logger.debug(f"Lighting changed in room {self.name}: is_lit={self.is_lit}")
+            self._emit(RoomEvent.LIGHT_CHANGED, is_lit)
 
     def add_monster(self, monster: Monster):
         self.monsters.append(monster)
@@ -65,6 +200,8 @@ class Room:
 
     def add_trap(self, trap: Trap):
         self.traps.append(trap)
+        if self._armed_traps is not None and not trap.disarmed:
+            self._armed_traps.append(trap)
         logger.debug(f"Added trap {trap.name} to room {self.name}")
 
     def add_puzzle(self, puzzle: Puzzle):
@@ -73,7 +210,9 @@ class Room:
 
     def add_light_source(self, light_source: LightSource):
         self.light_sources.append(light_source)
-        self.update_lighting()
+        if light_source.is_active:
+            self._active_lights += 1
+            self._set_lighting()
         logger.debug(f"Added light source {light_source.name} to room {self.name}")
 
     def add_npc(self, npc: NPC):
@@ -81,23 +220,44 @@ class Room:
         logger.debug(f"Added NPC {npc.name} to room {self.name}")
 
     def remove_monster(self, monster: Monster):
-        if monster in self.monsters:
+        if self._monsters and monster in self._monsters:
             self.monsters.remove(monster)
             logger.debug(f"Removed monster {monster.name} from room {self.name}")
 
+    def monster_died(self, monster: Monster):
+        self.remove_monster(monster)
+        self._emit(RoomEvent.MONSTER_DIED, monster)
+
     def remove_item(self, item: Item):
-        if item in self.items:
+        if self._items and item in self._items:
             self.items.remove(item)
             logger.debug(f"Removed item {item.name} from room {self.name}")
 
+    def pick_up_item(self, item: Item, character):
+        if self._items and item in self._items:
+            self.remove_item(item)
+            self._emit(RoomEvent.ITEM_PICKED_UP, item, character)
+
+    def disarm_trap(self, trap: Trap):
+        trap.disarmed = True
+        if self._armed_traps and trap in self._armed_traps:
+            self._armed_traps.remove(trap)
+        logger.debug(f"Disarmed trap {trap.name} in room {self.name}")
+
     def trigger_traps(self, character):
-        for trap in self.traps:
+        if self._armed_traps is None:
+            self._armed_traps = [trap for trap in self._traps or () if not trap.disarmed]
+        if not self._armed_traps:
+            return
+        for trap in self._armed_traps:
             if not trap.disarmed:
                 trap.trigger(character)
                 logger.debug(f"Triggered trap {trap.name} in room {self.name}")
+        # Traps disarmed without disarm_trap() are dropped here
+        self._armed_traps = [trap for trap in self._armed_traps if not trap.disarmed]
 
     def attempt_puzzle(self, character, solution: str) -> bool:
-        for puzzle in self.puzzles:
+        for puzzle in self._puzzles or ():
             if not puzzle.solved:
                 solved = puzzle.attempt_solution(character, solution)
                 if solved:
@@ -106,27 +266,37 @@ class Room:
         return False
 
     def update_lighting(self):
-        previous_state = self.is_lit
-        self.is_lit = any(light.is_active for light in self.light_sources) or self.room_type in [RoomType.TOWN, RoomType.TEMPLE]
-        if self.is_lit != previous_state:
-            logger.debug(f"Lighting changed in room {self.name}: is_lit={self.is_lit}")
+        """Recount active lights, e.g. after light sources were toggled directly."""
+        self._active_lights = sum(1 for light in self._light_sources or () if light.is_active)
+        self._set_lighting()
 
     def extinguish_light(self, light_source: LightSource):
-        if light_source in self.light_sources:
-            light_source.is_active = False
-            self.update_lighting()
+        if self._light_sources and light_source in self._light_sources:
+            if light_source.is_active:
+                light_source.is_active = False
+                self._active_lights -= 1
+                self._set_lighting()
             logger.debug(f"Extinguished light source {light_source.name} in room {self.name}")
 
+    def kindle_light(self, light_source: LightSource):
+        if self._light_sources and light_source in self._light_sources and not light_source.is_active:
+            light_source.is_active = True
+            self._active_lights += 1
+            self._set_lighting()
+            logger.debug(f"Lit light source {light_source.name} in room {self.name}")
+
     def enter(self, character):
         self.visited = True
         self.trigger_traps(character)
         if self.on_enter:
             self.on_enter(character)
-        if not self.is_lit and not any(monster.has_darkvision for monster in self.monsters):
+        self._emit(RoomEvent.ENTER, character)
+        if not self.is_lit and not any(getattr(monster, "has_darkvision", False) for monster in self._monsters or ()):
             logger.debug(f"Room {self.name} is dark, visibility limited")
         logger.info(f"Character entered room {self.name} (ID: {self.room_id})")
 
     def exit(self, character):
         if self.on_exit:
             self.on_exit(character)
+        self._emit(RoomEvent.EXIT, character)
         logger.info(f"Character exited room {self.name} (ID: {self.room_id})")
\ No newline at end of file
@@ -0,0 +1,45 @@
+from enum import Enum
+from typing import Callable, Dict, Tuple
+
+
+class RoomEvent(Enum):
+    """Events a room dispatches to its hooks; handlers are called as handler(room, *args)."""
+    ENTER = "enter"                    # (room, character)
+    EXIT = "exit"                      # (room, character)
+    LIGHT_CHANGED = "light_changed"    # (room, is_lit)
+    MONSTER_DIED = "monster_died"      # (room, monster)
+    ITEM_PICKED_UP = "item_picked_up"  # (room, item, character)
+
+
+class RoomHooks:
+    """Handlers per RoomEvent, kept as ready-to-call tuples.
+
+    Registration rebuilds the tuple for one event, so dispatch is a dict
+    lookup and a loop with no filtering. One instance lives on each RoomKind
+    (hooks for every room of that type) and, once used, on each Room.
+    """
+
+    __slots__ = ("_handlers",)
+
+    def __init__(self):
+        self._handlers: Dict[RoomEvent, Tuple[Callable, ...]] = {}
+
+    def __bool__(self) -> bool:
+        return bool(self._handlers)
+
+    def add(self, event: RoomEvent, handler: Callable):
+        self._handlers[event] = self._handlers.get(event, ()) + (handler,)
+
+    def remove(self, event: RoomEvent, handler: Callable):
+        handlers = tuple(h for h in self._handlers.get(event, ()) if h is not handler)
+        if handlers:
+            self._handlers[event] = handlers
+        else:
+            self._handlers.pop(event, None)
+
+    def get(self, event: RoomEvent) -> Tuple[Callable, ...]:
+        return self._handlers.get(event, ())
+
+    def dispatch(self, event: RoomEvent, room, *args):
+        for handler in self._handlers.get(event, ()):
+            handler(room, *args)
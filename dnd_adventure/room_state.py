@@ -0,0 +1,143 @@
+import copy
+import logging
+from typing import Dict, Iterable, List, Optional, Tuple
+from dnd_adventure.room import Room
+from dnd_adventure.dnd35e.core import Item
+from dnd_adventure.dnd35e.core.monsters import get_monster_by_name
+
+logger = logging.getLogger(__name__)
+
+# Delta keys, kept short because saves hold one delta per changed room:
+#   "v"  visited                      "m-" baseline monsters killed (indices)
+#   "hp" {baseline index: hit points}  "m+" monsters added, [name, hit points]
+#   "i-" baseline items taken         "i+" item names added
+#   "t"  traps disarmed (indices)     "p"  puzzles solved (indices)
+#   "l"  light sources toggled (indices)
+# Traps, puzzles and light sources come with the generated room; only their
+# state is recorded, by index.
+
+
+def _match(baseline: List, current: List) -> Tuple[Dict[int, object], List]:
+    """Pair current objects with baseline ones of the same name, in order.
+
+    Rooms only ever lose baseline objects or gain new ones at the end, so a
+    greedy in-order match recovers which baseline entries are still present.
+    Returns {baseline index: current object} and the unmatched current objects.
+    """
+    matched: Dict[int, object] = {}
+    added = []
+    start = 0
+    for obj in current:
+        for index in range(start, len(baseline)):
+            if baseline[index].name == obj.name:
+                matched[index] = obj
+                start = index + 1
+                break
+        else:
+            added.append(obj)
+    return matched, added
+
+
+def _flags(baseline: List, current: List, attr: str) -> List[int]:
+    return [index for index, (old, new) in enumerate(zip(baseline, current)) if getattr(old, attr) != getattr(new, attr)]
+
+
+def room_delta(baseline: Room, room: Room) -> Dict:
+    """What differs between a room and a freshly generated copy of it; {} if nothing."""
+    delta: Dict = {}
+    if room.visited != baseline.visited:
+        delta["v"] = int(room.visited)
+
+    old_monsters, monsters = baseline._monsters or [], room._monsters or []
+    matched, added = _match(old_monsters, monsters)
+    killed = [index for index in range(len(old_monsters)) if index not in matched]
+    hit_points = {str(index): monster.hit_points for index, monster in matched.items()
+                  if monster.hit_points != old_monsters[index].hit_points}
+    if killed:
+        delta["m-"] = killed
+    if hit_points:
+        delta["hp"] = hit_points
+    if added:
+        delta["m+"] = [[monster.name, monster.hit_points] for monster in added]
+
+    old_items, items = baseline._items or [], room._items or []
+    matched, added = _match(old_items, items)
+    taken = [index for index in range(len(old_items)) if index not in matched]
+    if taken:
+        delta["i-"] = taken
+    if added:
+        delta["i+"] = [item.name for item in added]
+
+    for key, slot, attr in (("t", "_traps", "disarmed"), ("p", "_puzzles", "solved"), ("l", "_light_sources", "is_active")):
+        changed = _flags(getattr(baseline, slot) or [], getattr(room, slot) or [], attr)
+        if changed:
+            delta[key] = changed
+    return delta
+
+
+def apply_delta(room: Room, delta: Dict):
+    """Replay a delta from room_delta onto a freshly generated room."""
+    if "v" in delta:
+        room.visited = bool(delta["v"])
+    if room._monsters:
+        for index, hit_points in delta.get("hp", {}).items():
+            room._monsters[int(index)].hit_points = hit_points
+        killed = set(delta.get("m-", ()))
+        room.monsters = [monster for index, monster in enumerate(room._monsters) if index not in killed]
+    for name, hit_points in delta.get("m+", ()):
+        template = get_monster_by_name(name)
+        if template is None:
+            logger.warning(f"Unknown monster {name} in saved state of room {room.name}")
+            continue
+        monster = copy.deepcopy(template)
+        monster.hit_points = hit_points
+        room.add_monster(monster)
+    if room._items:
+        taken = set(delta.get("i-", ()))
+        room.items = [item for index, item in enumerate(room._items) if index not in taken]
+    for name in delta.get("i+", ()):
+        room.add_item(Item(name))
+    for index in delta.get("t", ()):
+        room.traps[index].disarmed = not room.traps[index].disarmed
+    for index in delta.get("p", ()):
+        room.puzzles[index].solved = not room.puzzles[index].solved
+    for index in delta.get("l", ()):
+        room.light_sources[index].is_active = not room.light_sources[index].is_active
+    if delta.get("l"):
+        room.update_lighting()
+
+
+class RoomStateStore:
+    """Per-room deltas against the generated baseline, for saving and restoring room state.
+
+    Only rooms that differ from what the world would generate are recorded.
+    Loaded deltas stay pending until their room is next built, so restoring a
+    save never materializes rooms the player does not go back to.
+    """
+
+    def __init__(self):
+        self.pending: Dict[str, Dict] = {}
+
+    def load(self, data: Dict[str, Dict]):
+        self.pending = {room_id: dict(delta) for room_id, delta in data.items() if delta}
+        logger.info(f"Loaded state for {len(self.pending)} rooms")
+
+    def restore(self, room_id: str, room: Room) -> Room:
+        delta = self.pending.pop(room_id, None)
+        if delta:
+            apply_delta(room, delta)
+            logger.debug(f"Restored saved state of room {room_id}")
+        return room
+
+    def dump(self, rooms: Iterable[Tuple[str, Room, Optional[Room]]]) -> Dict[str, Dict]:
+        """Deltas for (room id, room, baseline) triples plus any still-pending ones."""
+        data = dict(self.pending)
+        for room_id, room, baseline in rooms:
+            if baseline is None:
+                continue
+            delta = room_delta(baseline, room)
+            if delta:
+                data[room_id] = delta
+            else:
+                data.pop(room_id, None)
+        return data
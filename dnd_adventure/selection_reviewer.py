@@ -82,7 +82,10 @@ def review_selections(selections: Dict, races: List, classes: Dict[str, dict]) -
         elif selected_index == 3:
             spellcasting_classes = ["Wizard", "Sorcerer", "Cleric", "Druid", "Bard", "Paladin", "Ranger", "Psion"]
             if selections["class"] in spellcasting_classes:
-                selections["spells"] = select_spells(selections["class"], character_level, selections["stat_dict"])
+                selections["spells"] = select_spells(
+                    selections["class"], character_level, selections["stat_dict"],
+                    seed=selections.get("spell_seed"), character=selections.get("name") or ""
+                )
                 logger.debug(f"Spells reselected for {selections['class']}: {selections['spells']}")
             else:
                 selections["spells"] = {0: [], 1: []}
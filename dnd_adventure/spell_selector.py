@@ -7,13 +7,16 @@ from dnd_adventure.spells import CORE_SPELLS, Spell
 
 logger = logging.getLogger(__name__)
 
-def select_spells(class_name: str, character_level: int, stat_dict: Dict[str, int], domain: Optional[str] = None) -> Dict[int, List[str]]:
+def select_spells(
+    class_name: str, character_level: int, stat_dict: Dict[str, int], domain: Optional[str] = None,
+    seed: Optional[int] = None, character: str = ""
+) -> Dict[int, List[str]]:
     spellcasting_classes = ["Wizard", "Sorcerer", "Cleric", "Druid", "Bard", "Paladin", "Ranger"]
     if class_name not in spellcasting_classes:
         logger.debug(f"No spells available for non-spellcasting class: {class_name}")
         return {0: [], 1: []}
 
-    loader = SpellLoader()
+    loader = SpellLoader(seed, character)
     spells = loader.load_spells_from_json()
     class_key = "Sorcerer/Wizard" if class_name in ["Wizard", "Sorcerer"] else class_name
     available_spells = spells.get(class_key, {0: [], 1: []})
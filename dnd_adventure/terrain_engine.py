@@ -0,0 +1,97 @@
+import hashlib
+import json
+import logging
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+from dnd_adventure.noise import GradientNoise
+from dnd_adventure.rng import RNGService
+from dnd_adventure.utils import load_biomes
+
+logger = logging.getLogger(__name__)
+
+# Terrain codes are the index into this tuple; arrays produced by the engine hold these codes.
+TERRAIN_TYPES: Tuple[str, ...] = ("plains", "forest", "mountain", "river", "lake", "ocean", "dungeon", "castle")
+TERRAIN_CODES: Dict[str, int] = {name: code for code, name in enumerate(TERRAIN_TYPES)}
+
+
+class TerrainEngine:
+    """Batched terrain generation: whole grids (or bands of rows) in one vectorized pass.
+
+    Noise fields and the thresholds that turn them into terrain come from the
+    biome table in resources/biomes.json. Each noise field is coherent gradient
+    noise, so neighbouring tiles form continents, coasts and mountain ranges.
+    """
+
+    def __init__(self, seed: int, biomes: Optional[Dict] = None):
+        self.seed = seed
+        self.rng = RNGService(seed)
+        self.biomes = biomes if biomes is not None else load_biomes()
+        self.config_hash = hashlib.sha1(json.dumps(self.biomes, sort_keys=True).encode("utf-8")).hexdigest()[:10]
+        self.field_configs: Dict[str, Dict] = self.biomes.get("noise", {})
+        self.rules: List[Dict] = self.biomes.get("biomes", [])
+        self.features: List[Dict] = self.biomes.get("features", [])
+        self._noises: Dict[int, GradientNoise] = {}
+        self.fields = {name: self.noise_for(seed + i) for i, name in enumerate(self.field_configs)}
+
+    def noise_for(self, seed: int) -> GradientNoise:
+        noise = self._noises.get(seed)
+        if noise is None:
+            noise = self._noises[seed] = GradientNoise(seed)
+        return noise
+
+    def field(self, name: str, xs: np.ndarray, ys: np.ndarray) -> np.ndarray:
+        """Sample a configured noise field, normalised to [0, 1]."""
+        config = self.field_configs[name]
+        scale = config.get("scale", 32.0)
+        values = self.fields[name].fbm(
+            xs / scale, ys / scale,
+            octaves=config.get("octaves", 4),
+            lacunarity=config.get("lacunarity", 2.0),
+            persistence=config.get("persistence", 0.5)
+        )
+        if config.get("ridged"):
+            return np.abs(values)
+        return np.clip(0.5 + 0.5 * values, 0.0, 1.0)
+
+    def generate_region(self, x0: int, y0: int, width: int, height: int) -> np.ndarray:
+        """Return a (height, width) uint8 array of terrain codes for the given region."""
+        ys, xs = np.mgrid[y0:y0 + height, x0:x0 + width]
+        fields = {name: self.field(name, xs, ys) for name in self.field_configs}
+        terrain = self.classify(fields)
+        return self.place_features(terrain, xs, ys)
+
+    def generate_band(self, y0: int, y1: int, width: int) -> np.ndarray:
+        return self.generate_region(0, y0, width, y1 - y0)
+
+    def classify(self, fields: Dict[str, np.ndarray]) -> np.ndarray:
+        """Apply the biome rules in order; the first rule whose bounds all hold wins."""
+        shape = next(iter(fields.values())).shape if fields else (0, 0)
+        conditions = []
+        choices = []
+        default = np.uint8(TERRAIN_CODES["plains"])
+        for rule in self.rules:
+            mask = np.ones(shape, dtype=bool)
+            bounded = False
+            for key, bound in rule.items():
+                if key.startswith("min_"):
+                    mask &= fields[key[4:]] >= bound
+                    bounded = True
+                elif key.startswith("max_"):
+                    mask &= fields[key[4:]] < bound
+                    bounded = True
+            code = np.uint8(TERRAIN_CODES[rule["terrain"]])
+            if not bounded:
+                default = code
+                break
+            conditions.append(mask)
+            choices.append(code)
+        return np.select(conditions, choices, default=default)
+
+    def place_features(self, terrain: np.ndarray, xs: np.ndarray, ys: np.ndarray) -> np.ndarray:
+        """Scatter dungeons, castles and other point features over their allowed terrain."""
+        keys = ys.astype(np.int64) * 1_000_003 + xs
+        for index, feature in enumerate(self.features):
+            allowed = np.isin(terrain, [TERRAIN_CODES[name] for name in feature.get("on", TERRAIN_TYPES)])
+            roll = self.rng.uniform(f"feature:{index}:{feature['terrain']}", keys)
+            terrain[allowed & (roll < feature.get("density", 0.0))] = TERRAIN_CODES[feature["terrain"]]
+        return terrain
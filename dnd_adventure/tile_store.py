@@ -0,0 +1,90 @@
+import logging
+from typing import Dict, Iterator, Optional
+import numpy as np
+from dnd_adventure.terrain_engine import TERRAIN_TYPES, TERRAIN_CODES
+from dnd_adventure.world_chunks import LocationsView
+from dnd_adventure.location_index import TerrainIndex
+
+logger = logging.getLogger(__name__)
+
+
+def country_dtype(num_countries: int) -> np.dtype:
+    """Smallest unsigned dtype that holds every country id plus the NO_COUNTRY sentinel."""
+    return np.dtype(np.uint8) if num_countries < np.iinfo(np.uint8).max else np.dtype(np.uint16)
+
+
+class TileStore:
+    """Struct-of-arrays storage for a rectangular block of tiles.
+
+    Terrain is kept as uint8 codes into TERRAIN_TYPES and countries as small
+    unsigned ids, with the dtype's max value meaning "no country". Tile dicts and
+    their names are built on demand, so a block costs two bytes or so per tile.
+    Coordinates passed to the accessors are world coordinates.
+    """
+
+    def __init__(self, x0: int, y0: int, terrain: np.ndarray, country: np.ndarray):
+        self.x0 = x0
+        self.y0 = y0
+        self.terrain = terrain
+        self.country = country
+        self.no_country = np.iinfo(country.dtype).max
+        self._terrain_index: Optional[TerrainIndex] = None
+
+    @classmethod
+    def from_terrain(cls, x0: int, y0: int, terrain: np.ndarray, num_countries: int) -> "TileStore":
+        dtype = country_dtype(num_countries)
+        return cls(x0, y0, terrain, np.full(terrain.shape, np.iinfo(dtype).max, dtype=dtype))
+
+    @property
+    def width(self) -> int:
+        return self.terrain.shape[1]
+
+    @property
+    def height(self) -> int:
+        return self.terrain.shape[0]
+
+    @property
+    def nbytes(self) -> int:
+        return self.terrain.nbytes + self.country.nbytes
+
+    @property
+    def terrain_index(self) -> TerrainIndex:
+        """Positions grouped by terrain, built on first use and dropped with the block."""
+        if self._terrain_index is None:
+            self._terrain_index = TerrainIndex(self)
+        return self._terrain_index
+
+    @property
+    def locations(self) -> LocationsView:
+        return LocationsView(self)
+
+    def in_bounds(self, x: int, y: int) -> bool:
+        return self.x0 <= x < self.x0 + self.width and self.y0 <= y < self.y0 + self.height
+
+    def terrain_at(self, x: int, y: int) -> str:
+        return TERRAIN_TYPES[self.terrain[y - self.y0, x - self.x0]]
+
+    def country_at(self, x: int, y: int) -> Optional[int]:
+        country = int(self.country[y - self.y0, x - self.x0])
+        return None if country == self.no_country else country
+
+    def get_tile(self, x: int, y: int) -> Dict:
+        terrain = self.terrain_at(x, y)
+        return {
+            "x": x,
+            "y": y,
+            "type": terrain,
+            "name": f"{terrain.capitalize()} at ({x},{y})",
+            "country": self.country_at(x, y)
+        }
+
+    def set_tile(self, x: int, y: int, tile: Dict):
+        self.terrain[y - self.y0, x - self.x0] = TERRAIN_CODES[tile["type"]]
+        country = tile.get("country")
+        self.country[y - self.y0, x - self.x0] = self.no_country if country is None else country
+        self._terrain_index = None
+
+    def iter_tiles(self) -> Iterator[Dict]:
+        for y in range(self.y0, self.y0 + self.height):
+            for x in range(self.x0, self.x0 + self.width):
+                yield self.get_tile(x, y)
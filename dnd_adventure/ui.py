@@ -1,6 +1,7 @@
 import os
 from typing import List, Optional, Tuple
 from colorama import Fore, Style
+from dnd_adventure.glyphs import PLAYER, BLANK, render_row
 import logging
 
 logger = logging.getLogger(__name__)
@@ -89,73 +90,35 @@ def display_current_map(game):
     tile = game.world.get_location(*game.last_world_pos)
     country_id = tile.get("country")
     country_name = "Unknown Lands"
-    if country_id is not None:
-        country = next((c for c in game.world.map["countries"] if c["id"] == country_id), None)
-        if country:
-            country_name = country["name"]
+    country = game.world.country_table.get(country_id)
+    if country:
+        country_name = country.name
     
+    darkvision = getattr(game.player, "has_darkvision", False)
+    room = game.game_world.rooms.get(game.current_room) if game.current_room else None
     if game.current_map:
         map_data = game.graphics["maps"][game.current_map]
         print(f"\n{Fore.CYAN}{map_data['description']} ({tile['name']} in {country_name}){Style.RESET_ALL}")
+        last_row = len(map_data["layout"]) - 1
+        visible = None
+        if room is not None and room.kind.map_data is not None:
+            visible = game.world.fov.room_view(room, (game.player_pos[0], last_row - game.player_pos[1]), darkvision)
+        glyphs = game.world.glyphs
         for y, row in enumerate(map_data["layout"]):
-            line = ""
+            cells = []
             for x, char in enumerate(row):
-                if (x, len(map_data["layout"]) - 1 - y) == game.player_pos:
-                    line += Fore.RED + "@" + Style.RESET_ALL
-                elif char == '@':
-                    line += " "
+                if (x, last_row - y) == game.player_pos:
+                    cells.append(PLAYER)
+                elif (visible is not None and (x, y) not in visible) or char == '@':
+                    cells.append(BLANK)
                 else:
-                    symbol_data = map_data["symbols"].get(char, {"symbol": char, "color": "white", "type": "unknown"})
-                    symbol = symbol_data["symbol"]
-                    color = symbol_data["color"]
-                    if color == "gray":
-                        line += Fore.LIGHTBLACK_EX + symbol + Style.RESET_ALL
-                    elif color == "dark_green":
-                        line += Fore.GREEN + symbol + Style.RESET_ALL
-                    elif color == "green":
-                        line += Fore.GREEN + symbol + Style.RESET_ALL
-                    elif color == "light_green":
-                        line += Fore.LIGHTGREEN_EX + symbol + Style.RESET_ALL
-                    elif color == "light_green_ex":
-                        line += Fore.LIGHTGREEN_EX + symbol + Style.RESET_ALL
-                    elif color == "blue":
-                        line += Fore.BLUE + symbol + Style.RESET_ALL
-                    elif color == "light_blue_ex":
-                        line += Fore.LIGHTBLUE_EX + symbol + Style.RESET_ALL
-                    elif color == "cyan":
-                        line += Fore.CYAN + symbol + Style.RESET_ALL
-                    elif color == "light_cyan_ex":
-                        line += Fore.LIGHTCYAN_EX + symbol + Style.RESET_ALL
-                    elif color == "yellow":
-                        line += Fore.YELLOW + symbol + Style.RESET_ALL
-                    elif color == "light_yellow_ex":
-                        line += Fore.LIGHTYELLOW_EX + symbol + Style.RESET_ALL
-                    elif color == "red":
-                        line += Fore.RED + symbol + Style.RESET_ALL
-                    elif color == "light_red_ex":
-                        line += Fore.LIGHTRED_EX + symbol + Style.RESET_ALL
-                    elif color == "brown":
-                        line += Fore.LIGHTRED_EX + symbol + Style.RESET_ALL
-                    elif color == "magenta":
-                        line += Fore.MAGENTA + symbol + Style.RESET_ALL
-                    elif color == "light_magenta_ex":
-                        line += Fore.LIGHTMAGENTA_EX + symbol + Style.RESET_ALL
-                    elif color == "light_black_ex":
-                        line += Fore.LIGHTBLACK_EX + symbol + Style.RESET_ALL
-                    elif color == "white":
-                        line += Fore.WHITE + symbol + Style.RESET_ALL
-                    elif color == "light_white_ex":
-                        line += Fore.LIGHTWHITE_EX + symbol + Style.RESET_ALL
-                    elif color == "black":
-                        line += Fore.BLACK + symbol + Style.RESET_ALL
-                    else:
-                        print(f"{Fore.YELLOW}Warning: Unsupported color '{color}' for symbol '{symbol}' in {game.current_map} map. Using default color.{Style.RESET_ALL}")
-                        logger.warning(f"Unsupported color '{color}' for symbol '{symbol}' in {game.current_map} map")
-                        line += symbol
-            print(line)
+                    cells.append(glyphs.map_glyph(game.current_map, char))
+            print(render_row(cells))
     else:
         print(f"\n{Fore.CYAN}You are in {tile['name']} at ({game.last_world_pos[0]},{game.last_world_pos[1]}) ({tile['type'].capitalize()}) in {country_name}{Style.RESET_ALL}")
-        print(game.world.display_map(game.last_world_pos))
+        print(game.world.display_map(
+            game.last_world_pos, lit=room.is_lit if room else True, darkvision=darkvision, explored=game.explored
+        ))
     
     if game.current_room:
         expected_room = f"{game.last_world_pos[0]},{game.last_world_pos[1]}" if tile["type"] in ["dungeon", "castle"] else None
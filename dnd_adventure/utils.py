@@ -25,4 +25,16 @@ def load_graphics() -> dict:
         return graphics
     except (FileNotFoundError, json.JSONDecodeError) as e:
         logger.error(f"Failed to load graphics: {e}")
-        return {"maps": {}}
\ No newline at end of file
+        return {"maps": {}}
+
+def load_biomes() -> dict:
+    biomes_path = os.path.join(os.path.dirname(__file__), '..', 'resources', 'biomes.json')
+    logger.debug(f"Reading biomes.json from {biomes_path}")
+    try:
+        with open(biomes_path, 'r', encoding='utf-8') as f:
+            biomes = json.load(f)
+        logger.debug("Biome table loaded")
+        return biomes
+    except (FileNotFoundError, json.JSONDecodeError) as e:
+        logger.error(f"Failed to load biomes: {e}")
+        return {"noise": {}, "biomes": [{"terrain": "plains"}], "features": []}
@@ -0,0 +1,298 @@
+import logging
+from collections import deque
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+import numpy as np
+from dnd_adventure.terrain_engine import TERRAIN_CODES
+
+if TYPE_CHECKING:
+    from dnd_adventure.world import World
+
+logger = logging.getLogger(__name__)
+
+IMPASSABLE: Tuple[str, ...] = ("mountain", "ocean")
+IMPASSABLE_CODES = np.array([TERRAIN_CODES[name] for name in IMPASSABLE], dtype=np.uint8)
+
+# Every room must be reachable from the start, and at least one tile of each
+# terrain a "reach" quest can ask for (QuestManager; there is no "city" terrain).
+ROOM_CODES = np.array([TERRAIN_CODES[name] for name in ("dungeon", "castle")], dtype=np.uint8)
+QUEST_TERRAINS: Tuple[str, ...] = ("forest", "lake")
+# Bump when the connection rules change so cached connections are planned again
+CONNECT_VERSION = 2
+
+Point = Tuple[int, int]
+
+
+def passable_mask(terrain: np.ndarray) -> np.ndarray:
+    return ~np.isin(terrain, IMPASSABLE_CODES)
+
+
+def label_components(passable: np.ndarray) -> Tuple[np.ndarray, int]:
+    """Label 4-connected walkable components, returning (labels, count).
+
+    Works on horizontal runs rather than tiles: each row is split into runs of
+    passable tiles, runs overlapping a run in the row above are unioned, and a
+    final pass writes the compacted label of every run. Labels are 1..count;
+    impassable tiles are 0.
+    """
+    height, width = passable.shape
+    parent = [0]
+
+    def find(label: int) -> int:
+        while parent[label] != label:
+            parent[label] = parent[parent[label]]
+            label = parent[label]
+        return label
+
+    rows = []
+    previous: List[Tuple[int, int, int]] = []
+    for y in range(height):
+        edges = np.flatnonzero(np.diff(np.concatenate(([0], passable[y].astype(np.int8), [0]))))
+        runs = []
+        j = 0
+        for start, end in zip(edges[0::2].tolist(), edges[1::2].tolist()):
+            while j < len(previous) and previous[j][1] <= start:
+                j += 1
+            label = 0
+            k = j
+            while k < len(previous) and previous[k][0] < end:
+                other = find(previous[k][2])
+                if not label:
+                    label = other
+                elif other != label:
+                    label, other = min(label, other), max(label, other)
+                    parent[other] = label
+                k += 1
+            if not label:
+                label = len(parent)
+                parent.append(label)
+            runs.append((start, end, label))
+        rows.append(runs)
+        previous = runs
+
+    roots = np.array([find(label) for label in range(len(parent))], dtype=np.int64)
+    compact = np.zeros(len(parent), dtype=np.int32)
+    unique_roots = np.unique(roots[1:])
+    compact[unique_roots] = np.arange(1, len(unique_roots) + 1, dtype=np.int32)
+    final = compact[roots]
+    labels = np.zeros((height, width), dtype=np.int32)
+    for y, runs in enumerate(rows):
+        for start, end, label in runs:
+            labels[y, start:end] = final[label]
+    return labels, len(unique_roots)
+
+
+def cheapest_join(passable: np.ndarray, labels: np.ndarray, joined: np.ndarray, point: Point, margin: int = 8) -> List[Point]:
+    """Path from `point`'s component to the nearest tile whose label is `joined`, crossing the fewest impassable tiles.
+
+    A 0-1 breadth-first search from every tile of point's component (entering
+    a passable tile costs 0, an impassable one 1) within a window around the
+    point; the window doubles until it holds a joined tile that can be reached.
+    Returns the path's tiles from the joined tile back to the start, or [] if
+    no joined tile exists.
+    """
+    height, width = passable.shape
+    x, y = point
+    label = int(labels[y, x])
+    while True:
+        x0, x1 = max(0, x - margin), min(width, x + margin + 1)
+        y0, y1 = max(0, y - margin), min(height, y + margin + 1)
+        window_labels = labels[y0:y1, x0:x1].ravel()
+        targets = joined[window_labels]
+        if targets.any():
+            w = x1 - x0
+            sources = np.flatnonzero(window_labels == label).tolist() if label else [(y - y0) * w + x - x0]
+            path = _search(passable[y0:y1, x0:x1].ravel().tolist(), targets.tolist(), sources, w)
+            if path:
+                return [(x0 + index % w, y0 + index // w) for index in path]
+        if x1 - x0 == width and y1 - y0 == height:
+            return []
+        margin *= 2
+
+
+def _search(passable: List[bool], targets: List[bool], sources: List[int], w: int) -> List[int]:
+    """0-1 BFS over a flattened window from sources to the first target; the path's indices, target first."""
+    size = len(passable)
+    cost = [size + 1] * size
+    came_from = [-1] * size
+    queue = deque()
+    for index in sources:
+        cost[index] = 0 if passable[index] else 1
+        queue.append(index)
+    while queue:
+        index = queue.popleft()
+        if targets[index]:
+            path = []
+            while index != -1:
+                path.append(index)
+                index = came_from[index]
+            return path
+        ix = index % w
+        for neighbour, inside in ((index + 1, ix + 1 < w), (index - 1, ix > 0), (index + w, index + w < size), (index - w, index >= w)):
+            if not inside:
+                continue
+            step = 0 if passable[neighbour] else 1
+            if cost[index] + step < cost[neighbour]:
+                cost[neighbour] = cost[index] + step
+                came_from[neighbour] = index
+                if step:
+                    queue.append(neighbour)
+                else:
+                    queue.appendleft(neighbour)
+    return []
+
+
+def join_components(passable: np.ndarray, labels: np.ndarray, count: int, points: List[Point]) -> Tuple[List[Point], int]:
+    """Tiles to clear so every point shares the first point's component.
+
+    `passable` and `labels` (a writable array as from label_components, with
+    `count` components) are updated in place rather than relabelled after each
+    connection: components are merged through a table of label roots, carved
+    tiles take the first point's label, and labels are compacted to 1..count
+    at the end. Returns the carved tiles and the new count.
+    """
+    height, width = labels.shape
+    carved: List[Point] = []
+    ax, ay = points[0]
+    if not labels[ay, ax]:
+        count += 1
+        labels[ay, ax] = count
+    main = int(labels[ay, ax])
+    roots = np.arange(count + 1, dtype=np.int64)
+
+    def carve(tiles: List[Point]):
+        """Clear the impassable tiles; their components and those touching them join main's."""
+        merged = {int(roots[labels[ty, tx]]) for tx, ty in tiles if labels[ty, tx]}
+        for tx, ty in tiles:
+            if passable[ty, tx]:
+                continue
+            passable[ty, tx] = True
+            labels[ty, tx] = main
+            carved.append((tx, ty))
+            for nx, ny in ((tx + 1, ty), (tx - 1, ty), (tx, ty + 1), (tx, ty - 1)):
+                if 0 <= nx < width and 0 <= ny < height and labels[ny, nx]:
+                    merged.add(int(roots[labels[ny, nx]]))
+        roots[np.isin(roots, list(merged))] = main
+
+    carve([points[0]])
+    joined = roots == main
+    for x, y in points[1:]:
+        if joined[labels[y, x]]:
+            continue
+        path = cheapest_join(passable, labels, joined, (x, y))
+        if not path:
+            logger.warning(f"Could not connect ({x}, {y}) to ({ax}, {ay})")
+            continue
+        carve(path)
+        joined = roots == main
+    unique_roots = np.unique(roots[1:])
+    compact = np.zeros(count + 1, dtype=labels.dtype)
+    compact[unique_roots] = np.arange(1, len(unique_roots) + 1)
+    labels[...] = compact[roots][labels]
+    return carved, len(unique_roots)
+
+
+class Connectivity:
+    """Walkable connected components of a World, for O(1) reachability queries.
+
+    Before the first query the world is connected: the fewest impassable tiles
+    are carved into plains so the start reaches every capital, every room and
+    one tile of each quest terrain. The carving is planned once per world on
+    the base tiles and cached; it is applied as base overlay edits, so it is
+    neither journaled nor saved.
+
+    Labels cover the whole map (base tiles plus overlay edits). They are cached
+    in the world's MapCache as a compact .npy array, memory-mapped on load,
+    next to an entry holding a digest of the terrain edits they saw. Edits that
+    change a tile's passability drop the labels until next use.
+    """
+
+    def __init__(self, world: "World"):
+        self.world = world
+        self._labels: Optional[np.ndarray] = None
+        self.count = 0
+        self.connected = False
+        world.overlay.listeners.append(self._on_edit)
+
+    def _on_edit(self, x: int, y: int, changed: Dict):
+        if self._labels is not None and "type" in changed:
+            if (changed["type"] in IMPASSABLE) != (self._labels[y, x] == 0):
+                self._labels = None
+
+    def terrain(self, with_edits: bool = True) -> np.ndarray:
+        """The whole map's terrain codes, by default with overlay edits applied. Touches every chunk."""
+        return self.world.terrain_window(0, 0, self.world.width, self.world.height, with_edits)
+
+    @property
+    def labels(self) -> np.ndarray:
+        if not self.connected:
+            self.connect_world()
+        if self._labels is None:
+            cache, key = self.world.map_cache, self.world.cache_key
+            cached = cache.load(key, "components")
+            labels = cache.load_array(key, "components") if cached is not None and cached["edits"] == self.world.overlay.digest() else None
+            if labels is not None and labels.shape == (self.world.height, self.world.width):
+                self._labels, self.count = labels, cached["count"]
+            else:
+                self._store(*label_components(passable_mask(self.terrain())))
+                logger.info(f"Labelled {self.count} walkable components for {key}")
+        return self._labels
+
+    def _store(self, labels: np.ndarray, count: int):
+        self._labels = labels.astype(np.uint16 if count <= np.iinfo(np.uint16).max else np.int32)
+        self.count = count
+        cache, key = self.world.map_cache, self.world.cache_key
+        cache.store_array(key, "components", self._labels)
+        cache.store(key, "components", {"edits": self.world.overlay.digest(), "count": count})
+
+    def component_at(self, x: int, y: int) -> int:
+        """Component id of a tile, or 0 if it is impassable."""
+        return int(self.labels[y, x])
+
+    def reachable(self, a: Point, b: Point) -> bool:
+        component = self.component_at(*a)
+        return component != 0 and component == self.component_at(*b)
+
+    def connect_world(self) -> List[Point]:
+        """Apply the world's carved connections, planning (and caching) them if needed."""
+        self.connected = True
+        cache, key = self.world.map_cache, self.world.cache_key
+        cached = cache.load(key, "connections")
+        planned = None
+        if cached is not None and cached["version"] == CONNECT_VERSION:
+            carved = [tuple(tile) for tile in cached["tiles"]]
+        else:
+            carved, planned = self._plan()
+            cache.store(key, "connections", {"version": CONNECT_VERSION, "tiles": carved})
+            logger.info(f"Carved {len(carved)} tiles to connect {key}")
+        had_edits = any("type" in edit for edit in self.world.overlay.edits.values())
+        for x, y in carved:
+            self.world.overlay.set_base(x, y, {"type": "plains"})
+        if planned is not None and not had_edits:
+            self._store(*planned)  # the planned labels are exactly those of the carved base map
+        return carved
+
+    def _plan(self) -> Tuple[List[Point], Tuple[np.ndarray, int]]:
+        """Tiles to carve on the base map, with the labels and count of the carved base map."""
+        terrain = self.terrain(with_edits=False)
+        passable = passable_mask(terrain)
+        labels, count = label_components(passable)
+        start = self.world.starting_position
+        capitals = [tuple(country["capital"]) for country in self.world.map["countries"]]
+        # One tile of every component holding rooms, in row-major order
+        ys, xs = np.nonzero(np.isin(terrain, ROOM_CODES) & (labels != 0))
+        _, first = np.unique(labels[ys, xs], return_index=True)
+        first.sort()
+        rooms = list(zip(xs[first].tolist(), ys[first].tolist()))
+        carved, count = join_components(passable, labels, count, [start] + capitals + rooms)
+        # Then the quest terrain tile nearest the start, for terrains the start cannot reach yet
+        main = labels[start[1], start[0]]
+        quests = []
+        for name in QUEST_TERRAINS:
+            ys, xs = np.nonzero(terrain == TERRAIN_CODES[name])
+            if len(xs) and not (labels[ys, xs] == main).any():
+                nearest = int(np.argmin(np.abs(xs - start[0]) + np.abs(ys - start[1])))
+                quests.append((int(xs[nearest]), int(ys[nearest])))
+        if quests:
+            more, count = join_components(passable, labels, count, [start] + quests)
+            carved += more
+        return carved, (labels, count)
@@ -1,135 +1,244 @@
 import logging
 import random
 from typing import Dict, List, Tuple, Optional
-from colorama import Fore, Style
+import numpy as np
 from dnd_adventure.map_generator import MapGenerator
+from dnd_adventure.map_cache import MapCache
+from dnd_adventure.world_chunks import ChunkedMap, LocationsView
+from dnd_adventure.world_overlay import WorldOverlay
+from dnd_adventure.location_index import WorldLocationIndex
+from dnd_adventure.walkability import Connectivity
+from dnd_adventure.pathfinding import PathFinder
+from dnd_adventure.map_pyramid import MapPyramid
+from dnd_adventure.country_stats import CountryTable
+from dnd_adventure.complexes import WorldComplexes
+from dnd_adventure.fov import FieldOfView
+from dnd_adventure.exploration import ExploredMap
+from dnd_adventure.glyphs import GlyphTable, PLAYER, BLANK, render_row
+from dnd_adventure.terrain_engine import TERRAIN_CODES
+from dnd_adventure.tile_store import TileStore, country_dtype
+from dnd_adventure.world_file import WorldFile
 
 logger = logging.getLogger(__name__)
 
 class World:
-    def __init__(self, seed: Optional[int] = None, graphics: Dict = None):
+    def __init__(
+        self,
+        seed: Optional[int] = None,
+        graphics: Dict = None,
+        width: int = 192,
+        height: int = 192,
+        chunk_size: int = 64,
+        max_chunks: int = 64,
+        map_cache: Optional[MapCache] = None
+    ):
         self.seed = seed if seed is not None else random.randint(0, 1000000)
         self.map_generator = MapGenerator(self.seed)
+        self.rng = self.map_generator.rng
         self.name = self.map_generator.generate_name()
         self.graphics = graphics if graphics else {}
-        self.map = self.map_generator.load_or_generate_map()
-        if not self.map or "locations" not in self.map or not self.map["locations"]:
-            logger.error("Map initialization failed: No valid locations found")
-            self.map = {
-                "width": 100,
-                "height": 100,
-                "locations": [[{"x": x, "y": y, "type": "void", "name": "Void", "country": None} for x in range(100)] for y in range(100)]
-            }
+        self.glyphs = GlyphTable(self.graphics)
+        self.width = width
+        self.height = height
+        countries = self.map_generator.generate_countries(width, height)
+        self.map_cache = map_cache or MapCache()
+        self.cache_key = self.map_generator.cache_key(width, height)
+        if self.map_cache.load(self.cache_key, "countries") != countries:
+            # Chunks are only valid for the capitals they were labelled against
+            self.map_cache.clear(self.cache_key)
+            self.map_cache.store(self.cache_key, "countries", countries)
+        self.map_cache.touch(self.cache_key)
+        self.world_file = WorldFile(
+            self.map_cache.world_file_path(self.cache_key), self.cache_key,
+            width, height, chunk_size, country_dtype(len(countries))
+        )
+        # Tiles are generated chunk by chunk on first access, so startup cost and
+        # resident memory follow what the player visits rather than world area.
+        self.chunks = ChunkedMap(
+            width, height,
+            lambda x0, y0, w, h: self._load_chunk(x0, y0, w, h, countries),
+            chunk_size=chunk_size,
+            max_chunks=max_chunks
+        )
+        # Edits never touch the base chunks; they are layered on top and saved with the game
+        self.overlay = WorldOverlay()
+        self.terrain_index = WorldLocationIndex(self)
+        self.connectivity = Connectivity(self)
+        self.pathfinder = PathFinder(self)
+        self.pyramid = MapPyramid(self)
+        self.country_table = CountryTable(self)
+        self.complexes = WorldComplexes(self)
+        self.fov = FieldOfView(self)
+        self.map = {
+            "width": width,
+            "height": height,
+            "locations": LocationsView(self),
+            "countries": countries
+        }
+        # Connections from here to every capital, room and quest terrain are carved on first use (see Connectivity)
         self.starting_position = self.get_default_starting_position()
         self.history = self.generate_history()
         logger.debug(f"World initialized with starting position: {self.starting_position}")
 
+    def _load_chunk(self, x0: int, y0: int, width: int, height: int, countries: List[Dict]) -> TileStore:
+        tiles = self.world_file.read_chunk(x0, y0, width, height)
+        if tiles is None:
+            self.world_file.write_chunk(self.map_generator.generate_region(x0, y0, width, height, countries))
+            tiles = self.world_file.read_chunk(x0, y0, width, height)
+        return tiles
+
+    def pregenerate(self, workers: Optional[int] = None):
+        """Generate every chunk missing from the world file, optionally in parallel."""
+        regions = []
+        for cx, cy in self.chunks.iter_chunk_coords():
+            bounds = self.chunks.chunk_bounds(cx, cy)
+            if not self.world_file.has_chunk(bounds[0], bounds[1]):
+                regions.append(bounds)
+        for tiles in self.map_generator.generate_regions(regions, self.map["countries"], workers):
+            self.world_file.write_chunk(tiles)
+        self.world_file.flush()
+        # Build (or load) the connections, walkability labels, overview pyramid and country table while we are at it
+        self.connectivity.labels
+        self.pyramid.levels
+        self.country_table.by_id
+        logger.info(f"Pregenerated {len(regions)} chunks for {self.cache_key}")
+
     def get_default_starting_position(self) -> Tuple[int, int]:
         # Prefer a dungeon as the starting point
-        try:
-            for y in range(self.map["height"]):
-                for x in range(self.map["width"]):
-                    loc = self.map["locations"][y][x]
-                    if loc.get("type") == "dungeon":
-                        logger.debug(f"Found dungeon at ({x}, {y}) for starting position")
-                        return (x, y)
-        except (KeyError, IndexError, TypeError) as e:
-            logger.error(f"Error accessing map locations: {e}")
+        position = self.terrain_index.first("dungeon")
+        if position is not None:
+            logger.debug(f"Found dungeon at {position} for starting position")
+            return position
         # Fallback to (5, 0)
         logger.warning("No dungeon found, using default starting position (5, 0)")
         return (5, 0)
 
     def generate_history(self) -> List[Dict]:
         history = []
-        num_eras = random.randint(3, 5)
+        rng = self.rng.stream("history")
+        num_eras = rng.randint(3, 5)
         current_year = 0
         for i in range(num_eras):
-            era_length = random.randint(100, 500)
+            era_length = rng.randint(100, 500)
             era = {
                 "name": f"Era {i + 1}",
                 "start_year": current_year,
                 "events": []
             }
-            num_events = random.randint(2, 5)
+            num_events = rng.randint(2, 5)
             for j in range(num_events):
-                event_year = current_year + random.randint(0, era_length)
-                event_desc = random.choice([
-                    f"The kingdom of {self.map_generator.generate_name()} is founded by a legendary hero.",
-                    f"A great war breaks out between {self.map_generator.generate_name()} and {self.map_generator.generate_name()}.",
-                    f"An ancient artifact, the {self.map_generator.generate_name()} Stone, is discovered.",
-                    f"The {self.map_generator.generate_name()} Plague devastates the population."
+                event_year = current_year + rng.randint(0, era_length)
+                event_desc = rng.choice([
+                    f"The kingdom of {self.map_generator.generate_name(rng)} is founded by a legendary hero.",
+                    f"A great war breaks out between {self.map_generator.generate_name(rng)} and {self.map_generator.generate_name(rng)}.",
+                    f"An ancient artifact, the {self.map_generator.generate_name(rng)} Stone, is discovered.",
+                    f"The {self.map_generator.generate_name(rng)} Plague devastates the population."
                 ])
                 era["events"].append({"year": event_year, "desc": event_desc})
             history.append(era)
             current_year += era_length
         return history
 
+    def get_tile(self, x: int, y: int) -> Dict:
+        return self.overlay.apply(self.chunks.get_tile(x, y))
+
+    def set_tile(self, x: int, y: int, tile: Dict):
+        """Store the fields of `tile` that differ from the current tile as an overlay edit."""
+        current = self.get_tile(x, y)
+        changed = {field: value for field, value in tile.items() if field not in ("x", "y") and current.get(field) != value}
+        if "type" in changed and tile.get("name") == f"{tile['type'].capitalize()} at ({x},{y})":
+            changed.pop("name", None)  # derived name, no need to store it
+        self.edit_tile(x, y, **changed)
+
+    def edit_tile(self, x: int, y: int, **fields):
+        if not self.chunks.in_bounds(x, y):
+            raise IndexError(f"Tile ({x}, {y}) is outside the world")
+        if "type" in fields and fields["type"] not in TERRAIN_CODES:
+            raise ValueError(f"Unknown terrain type: {fields['type']}")
+        self.overlay.set(x, y, fields)
+
     def get_location(self, x: int, y: int) -> Dict:
-        if 0 <= y < self.map["height"] and 0 <= x < self.map["width"]:
-            return self.map["locations"][y][x]
+        if self.chunks.in_bounds(x, y):
+            return self.get_tile(x, y)
         return {"type": "void", "name": "Void", "country": None}
 
-    def display_map(self, player_pos: Tuple[int, int]) -> str:
+    def _window(self, x0: int, y0: int, x1: int, y1: int, field: str) -> np.ndarray:
+        """Base-tile `field` ("terrain" or "country") of tiles [x0, x1) x [y0, y1), copied out of the chunks."""
+        size = self.chunks.chunk_size
+        window = None
+        for cy in range(y0 // size, (y1 - 1) // size + 1):
+            for cx in range(x0 // size, (x1 - 1) // size + 1):
+                tiles = self.chunks.get_chunk(cx, cy)
+                source = getattr(tiles, field)
+                if window is None:
+                    window = np.empty((y1 - y0, x1 - x0), dtype=source.dtype)
+                ax, ay = max(x0, tiles.x0), max(y0, tiles.y0)
+                bx, by = min(x1, tiles.x0 + source.shape[1]), min(y1, tiles.y0 + source.shape[0])
+                window[ay - y0:by - y0, ax - x0:bx - x0] = source[ay - tiles.y0:by - tiles.y0, ax - tiles.x0:bx - tiles.x0]
+        return window
+
+    def terrain_window(self, x0: int, y0: int, x1: int, y1: int, with_edits: bool = True) -> np.ndarray:
+        """Terrain codes of tiles [x0, x1) x [y0, y1), indexed [y, x], by default with overlay edits applied."""
+        terrain = self._window(x0, y0, x1, y1, "terrain")
+        if with_edits:
+            for (x, y), edit in self.overlay.items():
+                if "type" in edit and x0 <= x < x1 and y0 <= y < y1:
+                    terrain[y - y0, x - x0] = TERRAIN_CODES[edit["type"]]
+        return terrain
+
+    def country_window(self, x0: int, y0: int, x1: int, y1: int) -> np.ndarray:
+        """Country indices of tiles [x0, x1) x [y0, y1) with overlay edits applied.
+
+        Tiles without a country hold the dtype's maximum (TileStore.no_country).
+        """
+        country = self._window(x0, y0, x1, y1, "country")
+        no_country = np.iinfo(country.dtype).max
+        for (x, y), edit in self.overlay.items():
+            if "country" in edit and x0 <= x < x1 and y0 <= y < y1:
+                country[y - y0, x - x0] = no_country if edit["country"] is None else edit["country"]
+        return country
+
+    def display_map(
+        self, player_pos: Tuple[int, int], lit: bool = True, darkvision: bool = False,
+        explored: Optional[ExploredMap] = None
+    ) -> str:
+        """The tiles around the player that are in sight; mountains and darkness hide the rest.
+
+        With an explored map, tiles out of sight that were seen before are drawn dimmed (fog of war).
+        """
         view_radius = 5
         x, y = player_pos
+        visible = self.fov.world_view(player_pos, view_radius, lit, darkvision)
+        x0, y0 = max(0, x - view_radius), max(0, y - view_radius)
+        x1, y1 = min(self.width, x + view_radius + 1), min(self.height, y + view_radius + 1)
+        terrain = self.terrain_window(x0, y0, x1, y1).tolist()
+        glyphs, dimmed = self.glyphs.terrain, self.glyphs.dimmed
         map_display = []
-        for dy in range(view_radius, -view_radius - 1, -1):
-            row = ""
-            for dx in range(-view_radius, view_radius + 1):
-                map_x, map_y = x + dx, y + dy
-                if 0 <= map_x < self.map["width"] and 0 <= map_y < self.map["height"]:
-                    tile = self.get_location(map_x, map_y)
-                    terrain_type = tile["type"]
-                    if (map_x, map_y) == (x, y):
-                        row += Fore.RED + "@" + Style.RESET_ALL
-                    else:
-                        symbol_data = self.graphics.get("terrains", {}).get(terrain_type, {"symbol": "?", "color": "white"})
-                        symbol = symbol_data["symbol"]
-                        color = symbol_data["color"]
-                        if color == "gray":
-                            row += Fore.LIGHTBLACK_EX + symbol + Style.RESET_ALL
-                        elif color == "dark_green":
-                            row += Fore.GREEN + symbol + Style.RESET_ALL
-                        elif color == "green":
-                            row += Fore.GREEN + symbol + Style.RESET_ALL
-                        elif color == "light_green":
-                            row += Fore.LIGHTGREEN_EX + symbol + Style.RESET_ALL
-                        elif color == "light_green_ex":
-                            row += Fore.LIGHTGREEN_EX + symbol + Style.RESET_ALL
-                        elif color == "blue":
-                            row += Fore.BLUE + symbol + Style.RESET_ALL
-                        elif color == "light_blue_ex":
-                            row += Fore.LIGHTBLUE_EX + symbol + Style.RESET_ALL
-                        elif color == "cyan":
-                            row += Fore.CYAN + symbol + Style.RESET_ALL
-                        elif color == "light_cyan_ex":
-                            row += Fore.LIGHTCYAN_EX + symbol + Style.RESET_ALL
-                        elif color == "yellow":
-                            row += Fore.YELLOW + symbol + Style.RESET_ALL
-                        elif color == "light_yellow_ex":
-                            row += Fore.LIGHTYELLOW_EX + symbol + Style.RESET_ALL
-                        elif color == "red":
-                            row += Fore.RED + symbol + Style.RESET_ALL
-                        elif color == "light_red_ex":
-                            row += Fore.LIGHTRED_EX + symbol + Style.RESET_ALL
-                        elif color == "brown":
-                            row += Fore.LIGHTRED_EX + symbol + Style.RESET_ALL
-                        elif color == "magenta":
-                            row += Fore.MAGENTA + symbol + Style.RESET_ALL
-                        elif color == "light_magenta_ex":
-                            row += Fore.LIGHTMAGENTA_EX + symbol + Style.RESET_ALL
-                        elif color == "light_black_ex":
-                            row += Fore.LIGHTBLACK_EX + symbol + Style.RESET_ALL
-                        elif color == "white":
-                            row += Fore.WHITE + symbol + Style.RESET_ALL
-                        elif color == "light_white_ex":
-                            row += Fore.LIGHTWHITE_EX + symbol + Style.RESET_ALL
-                        elif color == "black":
-                            row += Fore.BLACK + symbol + Style.RESET_ALL
-                        else:
-                            print(f"{Fore.YELLOW}Warning: Unsupported color '{color}' for symbol '{symbol}' in terrain.{Style.RESET_ALL}")
-                            row += symbol
+        for map_y in range(y + view_radius, y - view_radius - 1, -1):
+            cells = []
+            for map_x in range(x - view_radius, x + view_radius + 1):
+                if (map_x, map_y) in visible:
+                    cells.append(PLAYER if (map_x, map_y) == (x, y) else glyphs[terrain[map_y - y0][map_x - x0]])
+                elif explored is not None and explored.is_explored(map_x, map_y):
+                    cells.append(dimmed[terrain[map_y - y0][map_x - x0]])
                 else:
-                    row += " "
-            map_display.append(row)
-        return "\n".join(map_display)
\ No newline at end of file
+                    cells.append(BLANK)
+            map_display.append(render_row(cells))
+        return "\n".join(map_display)
+
+    def display_overview(self, player_pos: Tuple[int, int], max_width: int = 64, max_height: int = 32, level: Optional[int] = None) -> str:
+        """Whole-world map drawn from the pyramid level that fits the given size, so its cost does not grow with the world."""
+        if level is None:
+            level = self.pyramid.level_for(max_width, max_height)
+        # Worlds no larger than the pyramid's min_size have no downsampled levels; show them tile for tile
+        level = min(max(level, 1), len(self.pyramid.levels) - 1)
+        grid = self.pyramid.levels[level] if level else self.terrain_window(0, 0, self.width, self.height)
+        px, py = player_pos[0] >> level, player_pos[1] >> level
+        glyphs = self.glyphs.terrain
+        map_display = []
+        for y in range(grid.shape[0] - 1, -1, -1):
+            map_display.append(render_row(
+                PLAYER if (x, y) == (px, py) else glyphs[code] for x, code in enumerate(grid[y].tolist())
+            ))
+        map_display.append(f"1 cell = {1 << level}x{1 << level} tiles")
+        return "\n".join(map_display)
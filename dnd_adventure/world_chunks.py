@@ -0,0 +1,112 @@
+import logging
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Callable, Dict, Iterator, Tuple
+
+if TYPE_CHECKING:
+    from dnd_adventure.tile_store import TileStore
+
+logger = logging.getLogger(__name__)
+
+ChunkLoader = Callable[[int, int, int, int], "TileStore"]
+
+
+class ChunkedMap:
+    """World tiles split into fixed-size chunks that are generated on first access.
+
+    `loader(x0, y0, width, height)` must be deterministic, so a chunk evicted from
+    the LRU cache can be regenerated identically later. Chunks are the read-only
+    generated base; edits live in a WorldOverlay layered on top.
+    """
+
+    def __init__(self, width: int, height: int, loader: ChunkLoader, chunk_size: int = 64, max_chunks: int = 64):
+        self.width = width
+        self.height = height
+        self.loader = loader
+        self.chunk_size = chunk_size
+        self.max_chunks = max_chunks
+        self.chunks_x = (width + chunk_size - 1) // chunk_size
+        self.chunks_y = (height + chunk_size - 1) // chunk_size
+        self._chunks: "OrderedDict[Tuple[int, int], TileStore]" = OrderedDict()
+
+    def in_bounds(self, x: int, y: int) -> bool:
+        return 0 <= x < self.width and 0 <= y < self.height
+
+    def chunk_bounds(self, cx: int, cy: int) -> Tuple[int, int, int, int]:
+        x0, y0 = cx * self.chunk_size, cy * self.chunk_size
+        return x0, y0, min(self.chunk_size, self.width - x0), min(self.chunk_size, self.height - y0)
+
+    def get_chunk(self, cx: int, cy: int) -> "TileStore":
+        key = (cx, cy)
+        chunk = self._chunks.get(key)
+        if chunk is not None:
+            self._chunks.move_to_end(key)
+            return chunk
+        x0, y0, w, h = self.chunk_bounds(cx, cy)
+        chunk = self.loader(x0, y0, w, h)
+        self._chunks[key] = chunk
+        logger.debug(f"Generated chunk ({cx}, {cy}) covering ({x0}, {y0}) {w}x{h}")
+        self._evict()
+        return chunk
+
+    def _evict(self):
+        while len(self._chunks) > self.max_chunks:
+            key, _ = self._chunks.popitem(last=False)
+            logger.debug(f"Evicted chunk {key}")
+
+    def get_tile(self, x: int, y: int) -> Dict:
+        return self.get_chunk(x // self.chunk_size, y // self.chunk_size).get_tile(x, y)
+
+    def iter_chunk_coords(self) -> Iterator[Tuple[int, int]]:
+        for cy in range(self.chunks_y):
+            for cx in range(self.chunks_x):
+                yield cx, cy
+
+    @property
+    def resident_chunks(self) -> int:
+        return len(self._chunks)
+
+
+class LocationsView:
+    """Read/write `locations[y][x]` access matching the old list-of-rows layout.
+
+    Works over any world-anchored tile source with `width`, `height`, `get_tile`
+    and `set_tile`: a World or a whole-map TileStore.
+    """
+
+    def __init__(self, source):
+        self._map = source
+
+    def __len__(self) -> int:
+        return self._map.height
+
+    def __getitem__(self, y: int) -> "RowView":
+        if not 0 <= y < self._map.height:
+            raise IndexError(f"Row {y} out of range")
+        return RowView(self._map, y)
+
+    def __iter__(self) -> Iterator["RowView"]:
+        for y in range(self._map.height):
+            yield RowView(self._map, y)
+
+
+class RowView:
+    def __init__(self, source, y: int):
+        self._map = source
+        self._y = y
+
+    def __len__(self) -> int:
+        return self._map.width
+
+    def __getitem__(self, x: int) -> Dict:
+        if not 0 <= x < self._map.width:
+            raise IndexError(f"Column {x} out of range")
+        return self._map.get_tile(x, self._y)
+
+    def __setitem__(self, x: int, tile: Dict):
+        if not 0 <= x < self._map.width:
+            raise IndexError(f"Column {x} out of range")
+        self._map.set_tile(x, self._y, tile)
+
+    def __iter__(self) -> Iterator[Dict]:
+        for x in range(self._map.width):
+            yield self._map.get_tile(x, self._y)
@@ -0,0 +1,105 @@
+import logging
+import os
+import struct
+from typing import Optional
+import numpy as np
+from dnd_adventure.tile_store import TileStore
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"DNDWORLD"
+FORMAT_VERSION = 1
+# magic, format version, world key, width, height, chunk size, country id itemsize
+HEADER = struct.Struct("<8sI64sIIIB")
+PAGE_SIZE = 4096
+
+
+class WorldFile:
+    """Binary, memory-mapped store of a world's generated base tiles.
+
+    Layout: a fixed header, one presence byte per chunk, then every chunk as a
+    page-aligned block of raw terrain codes followed by raw country ids. Blocks
+    are chunk-major, so touching a tile faults in only its own chunk. The file is
+    created sparse and chunks are written the first time they are generated;
+    later sessions map it and read chunks zero-copy.
+    """
+
+    def __init__(self, path: str, key: str, width: int, height: int, chunk_size: int, country_dtype: np.dtype):
+        self.path = path
+        self.key = key
+        self.width = width
+        self.height = height
+        self.chunk_size = chunk_size
+        self.country_dtype = np.dtype(country_dtype)
+        self.chunks_x = (width + chunk_size - 1) // chunk_size
+        self.chunks_y = (height + chunk_size - 1) // chunk_size
+        self.chunk_area = chunk_size * chunk_size
+        self.chunk_bytes = self.chunk_area * (1 + self.country_dtype.itemsize)
+        self.presence_offset = HEADER.size
+        self.data_offset = self._align(self.presence_offset + self.chunks_x * self.chunks_y)
+        self.file_size = self.data_offset + self.chunks_x * self.chunks_y * self.chunk_bytes
+        if not self._header_matches():
+            self._create()
+        self.mm = np.memmap(path, dtype=np.uint8, mode="r+", shape=(self.file_size,))
+        self.presence = self.mm[self.presence_offset:self.presence_offset + self.chunks_x * self.chunks_y]
+
+    @staticmethod
+    def _align(offset: int) -> int:
+        return (offset + PAGE_SIZE - 1) // PAGE_SIZE * PAGE_SIZE
+
+    def _header(self) -> bytes:
+        return HEADER.pack(
+            MAGIC, FORMAT_VERSION, self.key.encode("utf-8"), self.width, self.height,
+            self.chunk_size, self.country_dtype.itemsize
+        )
+
+    def _header_matches(self) -> bool:
+        try:
+            if os.path.getsize(self.path) != self.file_size:
+                return False
+            with open(self.path, "rb") as f:
+                return f.read(HEADER.size) == self._header()
+        except OSError:
+            return False
+
+    def _create(self):
+        if os.path.exists(self.path):
+            logger.warning(f"World file {self.path} is stale or incompatible, recreating it")
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        with open(self.path, "wb") as f:
+            f.write(self._header())
+            f.truncate(self.file_size)  # sparse: unwritten chunks take no disk space
+        logger.info(f"Created world file {self.path} ({self.width}x{self.height}, {self.chunks_x * self.chunks_y} chunks)")
+
+    def _chunk_index(self, x0: int, y0: int) -> int:
+        return (y0 // self.chunk_size) * self.chunks_x + x0 // self.chunk_size
+
+    def _views(self, index: int, width: int, height: int):
+        offset = self.data_offset + index * self.chunk_bytes
+        terrain = self.mm[offset:offset + self.chunk_area].reshape(self.chunk_size, self.chunk_size)
+        country = self.mm[offset + self.chunk_area:offset + self.chunk_bytes].view(self.country_dtype)
+        country = country.reshape(self.chunk_size, self.chunk_size)
+        return terrain[:height, :width], country[:height, :width]
+
+    def has_chunk(self, x0: int, y0: int) -> bool:
+        return bool(self.presence[self._chunk_index(x0, y0)])
+
+    def read_chunk(self, x0: int, y0: int, width: int, height: int) -> Optional[TileStore]:
+        """Return a read-only TileStore viewing the mapped chunk, or None if it was never written."""
+        index = self._chunk_index(x0, y0)
+        if not self.presence[index]:
+            return None
+        terrain, country = self._views(index, width, height)
+        terrain.flags.writeable = False
+        country.flags.writeable = False
+        return TileStore(x0, y0, terrain, country)
+
+    def write_chunk(self, tiles: TileStore):
+        index = self._chunk_index(tiles.x0, tiles.y0)
+        terrain, country = self._views(index, tiles.width, tiles.height)
+        terrain[:] = tiles.terrain
+        country[:] = tiles.country
+        self.presence[index] = 1  # set last, so a torn write leaves the chunk absent
+
+    def flush(self):
+        self.mm.flush()
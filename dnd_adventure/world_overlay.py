@@ -0,0 +1,114 @@
+import hashlib
+import json
+import logging
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+TileKey = Tuple[int, int]
+
+
+class WorldOverlay:
+    """Sparse tile edits layered over the generated (read-only) base map.
+
+    Only changed fields are stored, keyed by tile. The edits made in play form
+    the game's journal: entries() lists them, one line per edited tile, to be
+    written with the saved game, and replay() applies them again when it is
+    loaded. Nothing is written until the game is saved, so edits from one game
+    never leak into another on the same world, and the base map itself is never
+    written, so it can be shared between sessions.
+    """
+
+    def __init__(self):
+        self.edits: Dict[TileKey, Dict] = {}
+        self.base: Dict[TileKey, Dict] = {}  # derived edits such as carved connections; never journaled
+        self.version = 0
+        self.listeners: List[Callable[[int, int, Dict], None]] = []
+
+    def __len__(self) -> int:
+        return len(self.edits)
+
+    def __contains__(self, key: TileKey) -> bool:
+        return key in self.edits
+
+    def get(self, x: int, y: int) -> Optional[Dict]:
+        return self.edits.get((x, y))
+
+    def items(self) -> Iterator[Tuple[TileKey, Dict]]:
+        return iter(self.edits.items())
+
+    def digest(self, fields: Iterable[str] = ("type",)) -> str:
+        """Stable hash of the edits to the given fields, for keying data derived from them."""
+        fields = tuple(fields)
+        edits = sorted(
+            (x, y, [edit.get(name) for name in fields])
+            for (x, y), edit in self.edits.items() if any(name in edit for name in fields)
+        )
+        return hashlib.sha1(json.dumps([fields, edits]).encode("utf-8")).hexdigest()
+
+    def apply(self, tile: Dict) -> Dict:
+        """Return `tile` with any edits for its position merged in."""
+        edit = self.edits.get((tile["x"], tile["y"]))
+        if not edit:
+            return tile
+        tile.update(edit)
+        if "type" in edit and "name" not in edit:
+            tile["name"] = f"{tile['type'].capitalize()} at ({tile['x']},{tile['y']})"
+        return tile
+
+    def set(self, x: int, y: int, fields: Dict):
+        """Record an edit made in play; fields already holding the same value are left as they are."""
+        edit = self.edits.setdefault((x, y), {})
+        changed = {field: value for field, value in fields.items() if edit.get(field, object()) != value}
+        if not changed:
+            if not edit:
+                del self.edits[(x, y)]
+            return
+        edit.update(changed)
+        for field in changed:
+            self.base.get((x, y), {}).pop(field, None)
+        self.version += 1
+        for listener in self.listeners:
+            listener(x, y, changed)
+        logger.debug(f"World edit at ({x}, {y}): {changed}")
+
+    def set_base(self, x: int, y: int, fields: Dict):
+        """Record an edit derived from the world itself (e.g. a carved connection) rather than made in play.
+
+        Base edits are not journaled, since they can be derived again, and they
+        sit under the journaled edits: fields those already set are left alone.
+        """
+        edit = self.edits.setdefault((x, y), {})
+        own = {field for field in edit if field not in self.base.get((x, y), {})}
+        changed = {field: value for field, value in fields.items() if field not in own and edit.get(field, object()) != value}
+        if not changed:
+            if not edit:
+                del self.edits[(x, y)]
+            return
+        edit.update(changed)
+        self.base.setdefault((x, y), {}).update(changed)
+        self.version += 1
+        for listener in self.listeners:
+            listener(x, y, changed)
+
+    def entries(self) -> List[Dict]:
+        """The journal of edits made in play, one entry per edited tile, for saving with the game."""
+        entries = []
+        for (x, y), edit in self.edits.items():
+            base = self.base.get((x, y), {})
+            own = {field: value for field, value in edit.items() if field not in base}
+            if own:
+                entries.append({"x": x, "y": y, "set": own})
+        return entries
+
+    def replay(self, entries: Iterable[Dict]):
+        """Apply a saved journal; malformed entries are skipped."""
+        replayed = 0
+        for entry in entries:
+            try:
+                self.set(int(entry["x"]), int(entry["y"]), dict(entry["set"]))
+            except (KeyError, TypeError, ValueError):
+                logger.warning(f"Skipping corrupt world journal entry: {str(entry)[:80]}")
+                continue
+            replayed += 1
+        logger.info(f"Replayed {replayed} world edits")
@@ -285,12 +285,9 @@ class PlayerManager:
 
     def find_starting_position(self, game: Any) -> Tuple[int, int]:
         logger.debug("Searching for starting dungeon position")
-        locations = game.world.map.get("locations", [])
-        for y in range(game.world.map.get("height", 0)):
-            for x in range(game.world.map.get("width", 0)):
-                loc = locations[y][x]
-                if loc.get("type") == "dungeon":
-                    logger.debug(f"Found dungeon at ({x}, {y}) for starting position")
-                    return (x, y)
+        position = game.world.terrain_index.first("dungeon")
+        if position is not None:
+            logger.debug(f"Found dungeon at {position} for starting position")
+            return position
         logger.warning("No dungeon found, defaulting to (0, 0)")
         return (0, 0)
\ No newline at end of file